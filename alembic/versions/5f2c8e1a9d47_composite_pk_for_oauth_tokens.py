@@ -0,0 +1,29 @@
+"""composite primary key for oauth_tokens
+
+Revision ID: 5f2c8e1a9d47
+Revises: cbe457d6078c
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '5f2c8e1a9d47'
+down_revision: Union[str, None] = 'cbe457d6078c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Match the ORM model: one row per (client_id, integration_type). This is also the
+    # conflict target for the INSERT ... ON CONFLICT upsert in TokenStorageManager.write_token.
+    op.drop_constraint('oauth_tokens_pkey', 'oauth_tokens', type_='primary')
+    op.create_primary_key('oauth_tokens_pkey', 'oauth_tokens', ['client_id', 'integration_type'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('oauth_tokens_pkey', 'oauth_tokens', type_='primary')
+    op.create_primary_key('oauth_tokens_pkey', 'oauth_tokens', ['client_id'])
@@ -1,20 +1,32 @@
-from typing_extensions import Annotated
+import asyncio
+import contextlib
+import logging
 from datetime import datetime, timezone
-from starlette.responses import JSONResponse
+import aiohttp
+import uvicorn
+from starlette.applications import Starlette
+from starlette.routing import Mount
 from fastmcp import FastMCP
-from src.core.storeage_manager import TokenStorageManager
-from src.services.slack.tools import mcp as slack_mcp
-from src.services.slack.route import slack_mcp_route as slack_oauth_routes
-from src.services.slack.route import slack_oauth_callback
 from src.utils.config_handler import is_slack_enabled
+from src.utils.http_client import close_http_client, close_aiohttp_session, get_aiohttp_session
+from src.utils.env_handler import WEB_CONCURRENCY, LOG_LEVEL
+from src.utils.json_handler import ORJSONResponse
+from src.utils.database import engine
+from src.utils import crypto
 
-storageManager = TokenStorageManager()
+# Logging is configured once here; library modules only create named loggers
+logging.basicConfig(level=LOG_LEVEL)
+logger = logging.getLogger(__name__)
 
 # Create the main server
 mcp = FastMCP(name="MainServer")
 
-# Mount the Slack MCP server with the "slack" prefix AND the OAuth routes only if Slack is enabled in config
+# Mount the Slack MCP server with the "slack" prefix AND the OAuth routes only if Slack is enabled in config.
+# Slack modules are imported here so a disabled integration never loads slack_sdk or its tool registry.
 if is_slack_enabled():
+    from src.services.slack.tools import mcp as slack_mcp
+    from src.services.slack.route import slack_oauth_callback
+
     mcp.mount(slack_mcp, prefix="slack")
     mcp.custom_route("/slack/oauth/callback", methods=["GET"])(slack_oauth_callback)
 
@@ -23,12 +35,70 @@ if is_slack_enabled():
 @mcp.custom_route("/health", methods=["GET"])
 async def health_check(request):
     """Health check endpoint"""
-    return JSONResponse({
+    return ORJSONResponse({
         "status": "healthy",
         "service": "Slack OAuth MCP Server",
         "timestamp": datetime.now(timezone.utc).isoformat(),
     })
 
 
+# MCP sessions live in process memory, so multi-worker deployments must run stateless
+mcp_app = mcp.http_app(stateless_http=WEB_CONCURRENCY > 1)
+
+
+_WARM_UP_TIMEOUT_SECONDS = 5
+
+
+async def _warm_up() -> None:
+    """Pay one-off setup costs before the first tool call instead of during it.
+
+    Opens a pooled connection (TCP + TLS) to slack.com, checks out a database connection and
+    builds the token cipher. Every step is best effort and the network steps are time-boxed: a
+    failure is logged and the lazy path handles it on first use as before.
+    """
+    async def _slack() -> None:
+        async with get_aiohttp_session().head(
+            "https://slack.com/api/", timeout=aiohttp.ClientTimeout(total=_WARM_UP_TIMEOUT_SECONDS)
+        ):
+            pass
+
+    async def _connect() -> None:
+        async with engine.connect():
+            pass
+
+    async def _database() -> None:
+        # An unreachable database must not hold up startup for the driver's own connect timeout
+        await asyncio.wait_for(_connect(), _WARM_UP_TIMEOUT_SECONDS)
+
+    async def _cipher() -> None:
+        crypto.warm_up()
+
+    steps = {"database": _database(), "cipher": _cipher()}
+    if is_slack_enabled():
+        steps["slack"] = _slack()
+    results = await asyncio.gather(*steps.values(), return_exceptions=True)
+    for name, result in zip(steps, results):
+        if isinstance(result, Exception):
+            # repr: a timeout's message is empty
+            logger.warning("Startup warm-up of %s failed: %r", name, result)
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: Starlette):
+    """Run the MCP session manager, warm shared clients, and release them on shutdown"""
+    async with mcp_app.lifespan(app):
+        await _warm_up()
+        try:
+            yield
+        finally:
+            await close_http_client()
+            await close_aiohttp_session()
+            await engine.dispose()
+
+
+# ASGI entrypoint wrapping the MCP app so process-wide resources share its lifecycle
+app = Starlette(routes=[Mount("/", app=mcp_app)], lifespan=lifespan)
+
+
 if __name__ == "__main__":
-    mcp.run(transport="http", host="0.0.0.0", port=8000)
+    uvicorn.run("server:app", host="0.0.0.0", port=8000, workers=WEB_CONCURRENCY)
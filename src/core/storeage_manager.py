@@ -3,17 +3,22 @@ import os
 from datetime import datetime, timezone
 from typing import Dict, Optional
 
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy import create_engine, select
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import SQLAlchemyError
-import json
+from src.utils import json_handler
 from src.utils.database import SessionLocal
 from src.models.oauth_token import Base, OAuthToken
 from src.utils.env_handler import TOKEN_ENCRYPTION_KEYS
 from src.utils.crypto import encrypt_text, decrypt_text
+from src.utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Decoded tokens keyed by (client_id, integration_type). Module-level so every
+# TokenStorageManager instance shares it and write_token invalidates for all readers.
+_token_cache = TTLCache(maxsize=5000, ttl=60)
+
 
 class TokenStorageManager:
     """DB-backed OAuth token manager using SQLAlchemy"""
@@ -22,76 +27,88 @@ class TokenStorageManager:
         # Tables are created via Alembic migrations
         pass
 
-    def write_token(self, client_id: str, token_data: Dict, integration_type: str = "slack") -> None:
+    async def write_token(self, client_id: str, token_data: Dict, integration_type: str = "slack") -> None:
         """Upsert OAuth token for a client ID and integration type"""
-        try:
-            with SessionLocal() as session:
-                existing = session.execute(
-                    select(OAuthToken).where(
-                        OAuthToken.client_id == client_id,
-                        OAuthToken.integration_type == integration_type,
-                    )
-                ).scalar_one_or_none()
-
-                now = datetime.now(timezone.utc)
-                token_json = json.dumps(token_data)
+        now = datetime.now(timezone.utc)
+        token_json = json_handler.dumps(token_data)
 
-                # Encrypt if keys configured
-                if TOKEN_ENCRYPTION_KEYS:
-                    try:
-                        token_json = encrypt_text(token_json, TOKEN_ENCRYPTION_KEYS)
-                    except Exception:
-                        logger.exception("Failed to encrypt oauth token; aborting write")
-                        raise
+        # Encrypt if keys configured
+        if TOKEN_ENCRYPTION_KEYS:
+            try:
+                token_json = encrypt_text(token_json)
+            except Exception:
+                logger.exception("Failed to encrypt oauth token; aborting write")
+                raise
 
-                if existing:
-                    existing.token_json = token_json
-                    existing.stored_at = now
-                else:
-                    session.add(
-                        OAuthToken(
-                            client_id=client_id,
-                            integration_type=integration_type,
-                            token_json=token_json,
-                            stored_at=now,
-                        )
-                    )
-                session.commit()
-                logger.info(f"Stored OAuth token for client: {client_id} ({integration_type})")
+        # Single round trip and race-free: INSERT ... ON CONFLICT (client_id, integration_type) DO UPDATE
+        stmt = pg_insert(OAuthToken).values(
+            client_id=client_id,
+            integration_type=integration_type,
+            token_json=token_json,
+            stored_at=now,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[OAuthToken.client_id, OAuthToken.integration_type],
+            set_={"token_json": stmt.excluded.token_json, "stored_at": stmt.excluded.stored_at},
+        )
+        try:
+            async with SessionLocal() as session:
+                await session.execute(stmt)
+                await session.commit()
+                _token_cache.pop((client_id, integration_type), None)
+                logger.info("Stored OAuth token for client: %s (%s)", client_id, integration_type)
         except SQLAlchemyError as e:
-            logger.error(f"DB error writing token: {e}")
+            logger.error("DB error writing token: %s", e)
             raise
 
-    def read_token(self, client_id: str, integration_type: str = "slack") -> Optional[Dict]:
+    async def read_token(self, client_id: str, integration_type: str = "slack") -> Optional[Dict]:
         """Read OAuth token for a client ID and integration type"""
+        cache_key = (client_id, integration_type)
+        cached = _token_cache.get(cache_key)
+        if cached is not None:
+            return cached
         try:
-            with SessionLocal() as session:
-                row = session.execute(
-                    select(OAuthToken).where(
+            async with SessionLocal() as session:
+                # Only the payload column is needed; skip ORM entity construction
+                raw = (await session.execute(
+                    select(OAuthToken.token_json).where(
                         OAuthToken.client_id == client_id,
                         OAuthToken.integration_type == integration_type,
                     )
-                ).scalar_one_or_none()
-                if not row:
-                    logger.debug(f"No token found for client: {client_id} ({integration_type})")
+                )).scalar_one_or_none()
+                if raw is None:
+                    logger.debug("No token found for client: %s (%s)", client_id, integration_type)
                     return None
-                raw = row.token_json
-                data_str, was_encrypted = decrypt_text(raw, TOKEN_ENCRYPTION_KEYS)
-                if was_encrypted:
-                    if data_str is None:
-                        # Encrypted but cannot decrypt
-                        logger.error("Token present but cannot decrypt (check keys/rotation)")
-                        return None
-                else:
-                    # plaintext legacy row; keep as-is
-                    data_str = raw
-                try:
-                    data = json.loads(data_str) if data_str else None
-                except Exception:
-                    logger.exception("Failed to parse token_json as JSON")
-                    data = None
+                data = self._decode_token_json(raw)
+                if data is not None:
+                    _token_cache.set(cache_key, data)
                 return data
         except SQLAlchemyError as e:
-            logger.error(f"DB error reading token: {e}")
+            logger.error("DB error reading token: %s", e)
+            return None
+
+    def invalidate(self, client_id: str, integration_type: str = "slack") -> None:
+        """Drop the cached token so the next read goes to the database"""
+        _token_cache.pop((client_id, integration_type), None)
+
+    @staticmethod
+    def _decode_token_json(raw: str) -> Optional[Dict]:
+        """Decrypt (when encrypted) and parse a stored token_json value"""
+        data_str, was_encrypted = decrypt_text(raw)
+        if was_encrypted:
+            if data_str is None:
+                # Encrypted but cannot decrypt
+                logger.error("Token present but cannot decrypt (check keys/rotation)")
+                return None
+        else:
+            # plaintext legacy row; keep as-is
+            data_str = raw
+        try:
+            return json_handler.loads(data_str) if data_str else None
+        except Exception:
+            logger.exception("Failed to parse token_json as JSON")
             return None
 
+
+# Shared instance imported by the Slack service, tools and OAuth route
+storageManager = TokenStorageManager()
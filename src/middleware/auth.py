@@ -1,21 +1,54 @@
-from fastmcp.server.dependencies import get_http_headers
+from fastmcp.server.dependencies import get_http_request
 from fastmcp.server.middleware import Middleware, MiddlewareContext
 from fastmcp import Context
-from typing import Optional, Dict, Any
+from starlette.requests import ClientDisconnect
+from types import MappingProxyType
+from typing import Optional, Dict, Any, FrozenSet, Iterable, List, Mapping, Tuple
+import asyncio
+import re
 import time
-import httpx
+import hashlib
+import base64
 import jwt as pyjwt
-from jwt import algorithms
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
 from src.utils.env_handler import (
     JWT_JWKS_URL as ENV_JWKS_URL,
     AUTH_ALLOW_USER_ID_HEADER as ENV_AUTH_ALLOW_USER_ID_HEADER,
     AUTH_USER_ID_HEADER_NAME as ENV_AUTH_USER_ID_HEADER_NAME,
 )
+from src.utils.http_client import get_http_client
+from src.utils.cache import TTLCache
+from src.utils import json_handler
 import logging
-import json
 
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
+_JWKS_HEADERS = {"Accept": "application/json"}
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+_MIN_JWKS_MAX_AGE = 60
+# After a refresh attempt (successful or not) the IdP is not asked again for this long
+_JWKS_RETRY_BACKOFF_SECONDS = 5
+# Shared read-only "no keys" map, returned instead of allocating an empty dict per call
+_EMPTY_JWKS: Mapping[str, Any] = MappingProxyType({})
+_EC_CURVES = {"P-256": ec.SECP256R1(), "P-384": ec.SECP384R1(), "P-521": ec.SECP521R1()}
+_DEFAULT_JWKS_ALGORITHMS = ("RS256", "RS384", "RS512", "PS256", "PS384", "PS512", "ES256", "ES384", "ES512")
+
+
+def _b64url_int(value: str) -> int:
+    """Decode a base64url (unpadded) JWK member into an integer"""
+    return int.from_bytes(base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)), "big")
+
+
+def _get_request_header(name: str) -> Optional[str]:
+    """Read one header from the current HTTP request without copying the whole header set"""
+    try:
+        return get_http_request().headers.get(name)
+    except RuntimeError:
+        # Not running inside an HTTP request (e.g. stdio transport)
+        return None
+
+
 # JWT Auth Middleware
 class JWTAuthMiddleware(Middleware):
     def __init__(
@@ -27,6 +60,10 @@ class JWTAuthMiddleware(Middleware):
         allow_user_id_header: Optional[bool] = None,
         user_id_header_name: Optional[str] = None,
         jwks_ttl_seconds: int = 3600,
+        allowed_algorithms: Optional[Iterable[str]] = None,
+        token_cache_ttl_seconds: int = 300,
+        token_cache_maxsize: int = 10_000,
+        negative_cache_ttl_seconds: int = 30,
     ):
         # Backward compatible ctor: accept HS256 secret or a JWKS URL via secret_key
         self.secret_key = secret_key
@@ -39,6 +76,19 @@ class JWTAuthMiddleware(Middleware):
             or (secret_key if (isinstance(secret_key, str) and secret_key.startswith("http")) else None)
             or ENV_JWKS_URL
         )
+        # Decode arguments are fixed for the middleware's lifetime; build them once
+        self._decode_kwargs: Dict[str, Any] = {}
+        if self.issuer:
+            self._decode_kwargs["issuer"] = self.issuer
+        if self.audience:
+            self._decode_kwargs["audience"] = self.audience
+        # Asymmetric algorithms accepted for JWKS-verified tokens
+        self.allowed_algorithms: FrozenSet[str] = frozenset(allowed_algorithms or _DEFAULT_JWKS_ALGORITHMS)
+        self._jwks_algorithms_list: List[str] = sorted(self.allowed_algorithms)
+        # secret_key doubles as a JWKS URL for backward compatibility; only a real secret is an HMAC key
+        hs_secret = secret_key if secret_key and not secret_key.startswith("http") else None
+        self._hs_key: Optional[bytes] = hs_secret.encode("utf-8") if hs_secret else None
+
         # Feature flag: allow user id via header
         env_allow = str(ENV_AUTH_ALLOW_USER_ID_HEADER or "false").lower() in {"1", "true", "yes"}
         self.allow_user_id_header = allow_user_id_header if allow_user_id_header is not None else env_allow
@@ -46,161 +96,230 @@ class JWTAuthMiddleware(Middleware):
             user_id_header_name or ENV_AUTH_USER_ID_HEADER_NAME or "x-user-id"
         ).lower()
 
-        # JWKS cache
-        self._jwks_cache: Dict[str, Any] = {}
+        # JWKS cache: kid -> public key object
+        self._jwks_keys: Mapping[str, Any] = _EMPTY_JWKS
         self._jwks_last_fetch: float = 0.0
+        self._jwks_last_attempt: float = 0.0
         self._jwks_ttl_seconds = jwks_ttl_seconds
+        self._jwks_lock = asyncio.Lock()
+        self._jwks_max_age: float = jwks_ttl_seconds
+        self._jwks_etag: Optional[str] = None
+        self._jwks_last_modified: Optional[str] = None
+
+        # Verified payload cache (sha256(token) -> payload, or None for rejected tokens)
+        self._token_cache = TTLCache(maxsize=token_cache_maxsize, ttl=token_cache_ttl_seconds)
+        self._token_ttl_seconds = token_cache_ttl_seconds
+        self._negative_ttl_seconds = negative_cache_ttl_seconds
 
         logger.debug("JWTAuthMiddleware configured: jwks_url=%s, allow_user_id_header=%s, user_id_header_name=%s",
                      self.jwks_url, self.allow_user_id_header, self.user_id_header_name)
 
     def extract_token_from_context(self, context: MiddlewareContext) -> Optional[str]:
         try:
-            headers = get_http_headers(include_all=True)
-            logger.debug("Extracting token from headers: %s", headers)
-            auth_header = headers.get("authorization")
-            if auth_header and auth_header.lower().startswith("bearer "):
-                token = auth_header.split(" ", 1)[1]
-                return token
+            return self._parse_bearer(_get_request_header("authorization"))
         except Exception as e:
             logger.exception("Failed to extract token from context: %s", e)
         return None
 
-    async def _fetch_jwks(self) -> Dict[str, Any]:
+    @staticmethod
+    def _parse_bearer(auth_header: Optional[str]) -> Optional[str]:
+        # Compare only the scheme prefix; never lower-case or split the whole header
+        if auth_header and auth_header[:7].lower() == "bearer ":
+            return auth_header[7:].strip() or None
+        return None
+
+    @staticmethod
+    def _build_public_key(jwk: Dict[str, Any]) -> Optional[Any]:
+        """Turn a single JWK into a cryptography public key object"""
+        kty = jwk.get("kty")
+        try:
+            # Build straight from the JWK members; avoids the dumps/loads round trip through from_jwk
+            if kty == "RSA":
+                return rsa.RSAPublicNumbers(_b64url_int(jwk["e"]), _b64url_int(jwk["n"])).public_key()
+            if kty == "EC":
+                curve = _EC_CURVES.get(jwk.get("crv"))
+                if curve is None:
+                    logger.warning("Unsupported EC curve in JWK (kid=%s, crv=%s)", jwk.get("kid"), jwk.get("crv"))
+                    return None
+                return ec.EllipticCurvePublicNumbers(_b64url_int(jwk["x"]), _b64url_int(jwk["y"]), curve).public_key()
+            logger.warning("Unsupported JWK key type (kid=%s, kty=%s)", jwk.get("kid"), kty)
+        except Exception as e:
+            logger.exception("Failed to construct public key from JWK (kid=%s, kty=%s): %s", jwk.get("kid"), kty, e)
+        return None
+
+    async def _fetch_jwks(self) -> Mapping[str, Any]:
+        """Return the kid -> public key map, refreshing it from the JWKS URL when stale"""
         if not self.jwks_url:
             logger.debug("No JWKS URL configured, skipping fetch.")
-            return {"keys": []}
+            return _EMPTY_JWKS
+        # If cache exists and is fresh, or the IdP was just tried, return what we have
+        if not self._jwks_needs_refresh():
+            return self._jwks_keys
+        # Single-flight: concurrent callers wait for one refresh instead of each hitting the IdP;
+        # callers queued behind a failed refresh get the current map back rather than retrying
+        async with self._jwks_lock:
+            if not self._jwks_needs_refresh():
+                return self._jwks_keys
+            try:
+                await self._refresh_jwks()
+            finally:
+                self._jwks_last_attempt = time.time()
+        return self._jwks_keys
+
+    def _jwks_needs_refresh(self) -> bool:
+        now = time.time()
+        if self._jwks_keys and (now - self._jwks_last_fetch) < self._jwks_max_age:
+            return False
+        return (now - self._jwks_last_attempt) >= _JWKS_RETRY_BACKOFF_SECONDS
+
+    async def _refresh_jwks(self) -> None:
         now = time.time()
-        # If cache exists and is fresh, return it
-        if self._jwks_cache and (now - self._jwks_last_fetch) < self._jwks_ttl_seconds:
-            logger.debug("Using cached JWKS (age=%.1fs)", now - self._jwks_last_fetch)
-            return self._jwks_cache
         try:
             logger.debug("Fetching JWKS from %s", self.jwks_url)
-            async with httpx.AsyncClient(timeout=5) as client:
-                resp = await client.get(self.jwks_url)
-                resp.raise_for_status()
-                data = resp.json()
-                # Normalize to dict with 'keys'
-                if isinstance(data, dict) and "keys" in data:
-                    self._jwks_cache = data
-                else:
-                    self._jwks_cache = {"keys": data if isinstance(data, list) else []}
+            client = get_http_client()
+            headers = _JWKS_HEADERS
+            # Conditional GET: an unchanged key set costs a 304 instead of a download + key rebuild
+            if self._jwks_keys and (self._jwks_etag or self._jwks_last_modified):
+                headers = dict(_JWKS_HEADERS)
+                if self._jwks_etag:
+                    headers["If-None-Match"] = self._jwks_etag
+                if self._jwks_last_modified:
+                    headers["If-Modified-Since"] = self._jwks_last_modified
+            resp = await client.get(self.jwks_url, headers=headers, timeout=5)
+            if resp.status_code == 304:
                 self._jwks_last_fetch = now
-                logger.debug("JWKS fetched: %d keys", len(self._jwks_cache.get("keys", [])))
+                self._jwks_max_age = self._max_age_from(resp)
+                logger.debug("JWKS not modified")
+                return
+            if resp.status_code != 200:
+                logger.error("JWKS fetch from %s returned HTTP %d", self.jwks_url, resp.status_code)
+                return
+            data = json_handler.loads(resp.content)
+            # Accept either {"keys": [...]} or a bare list
+            jwks = data.get("keys", []) if isinstance(data, dict) else data if isinstance(data, list) else []
+            # Build key objects once per fetch so verification is a dict lookup
+            keys_by_kid: Dict[str, Any] = {}
+            for jwk in jwks:
+                kid = jwk.get("kid") if isinstance(jwk, dict) else None
+                if not kid:
+                    continue
+                key = self._build_public_key(jwk)
+                if key is not None:
+                    keys_by_kid[kid] = key
+            self._jwks_keys = keys_by_kid
+            self._jwks_last_fetch = now
+            self._jwks_max_age = self._max_age_from(resp)
+            self._jwks_etag = resp.headers.get("etag")
+            self._jwks_last_modified = resp.headers.get("last-modified")
+            logger.debug("JWKS fetched: %d keys", len(keys_by_kid))
         except Exception as e:
             # Leave cache as-is on failure but log the error
             logger.exception("Failed to fetch JWKS from %s: %s", self.jwks_url, e)
-            if not self._jwks_cache:
-                # Ensure we return a consistent structure
-                self._jwks_cache = {"keys": []}
-        return self._jwks_cache
 
-    async def _get_public_key_from_jwks(self, token: str) -> Optional[Any]:
+    def _max_age_from(self, resp) -> float:
+        """Honor the IdP's Cache-Control max-age (floored at a minute); fall back to the configured TTL"""
+        match = _MAX_AGE_RE.search(resp.headers.get("cache-control", ""))
+        if not match:
+            return self._jwks_ttl_seconds
+        return max(_MIN_JWKS_MAX_AGE, int(match.group(1)))
+
+    async def _get_public_key_from_jwks(self, header: Dict[str, Any]) -> Optional[Any]:
+        """Look up the signing key for an already-parsed token header"""
         try:
-            header = pyjwt.get_unverified_header(token)
             kid = header.get("kid")
-            alg = header.get("alg")
             if not kid:
                 logger.warning("Token header has no 'kid'")
                 return None
-            jwks = await self._fetch_jwks()
-            for jwk in jwks.get("keys", []):
-                if jwk.get("kid") == kid:
-                    # Prepare JWK JSON string
-                    try:
-                        jwk_json = json.dumps(jwk)
-                    except Exception:
-                        jwk_json = None
-                    kty = jwk.get("kty")
-                    try:
-                        if kty == "RSA":
-                            # RSA public key
-                            if jwk_json:
-                                return algorithms.RSAAlgorithm.from_jwk(jwk_json)
-                            else:
-                                # fallback: try passing dict (some versions accept it)
-                                return algorithms.RSAAlgorithm.from_jwk(jwk)
-                        elif kty == "EC":
-                            if jwk_json:
-                                return algorithms.ECAlgorithm.from_jwk(jwk_json)
-                            else:
-                                return algorithms.ECAlgorithm.from_jwk(jwk)
-                        else:
-                            # Try generic from_jwk with JSON string when possible
-                            if jwk_json:
-                                return algorithms.RSAAlgorithm.from_jwk(jwk_json)
-                    except Exception as e:
-                        logger.exception("Failed to construct public key from JWK (kid=%s, kty=%s): %s", kid, kty, e)
-                        # continue trying other keys (unlikely)
-            logger.warning("No matching JWK found for kid=%s", kid)
+            keys_by_kid = await self._fetch_jwks()
+            key = keys_by_kid.get(kid)
+            if key is None:
+                logger.warning("No matching JWK found for kid=%s", kid)
+            return key
         except Exception as e:
             logger.exception("Error while extracting public key from JWKS: %s", e)
             return None
-        return None
 
     async def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
+        # Clients reuse the same bearer token across many tool calls; serve repeats from cache.
+        # Keyed by a digest so raw tokens are never kept in memory.
+        cache_key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        cached = self._token_cache.get(cache_key, _MISSING)
+        if cached is not _MISSING:
+            return cached
+        payload, definitive = await self._decode_token(token)
+        if payload is None:
+            # Only tokens that failed verification are remembered; a missing key or JWKS outage
+            # is retried on the next call so valid tokens recover as soon as the IdP does
+            if definitive:
+                self._token_cache.set(cache_key, None, ttl=self._negative_ttl_seconds)
+        else:
+            ttl = self._token_ttl_seconds
+            exp = payload.get("exp")
+            if isinstance(exp, (int, float)):
+                ttl = min(ttl, exp - time.time())
+            self._token_cache.set(cache_key, payload, ttl=ttl)
+        return payload
+
+    async def _decode_token(self, token: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Return ``(payload, definitive)``; ``definitive`` is False when the outcome may change on retry"""
         try:
-            # Try JWKS-based verification first (RS* family)
+            # Parse the header once and route on its alg: HMAC tokens never touch the JWKS path
+            header = pyjwt.get_unverified_header(token)
+            alg = header.get("alg") or ""
+            if alg.startswith("HS") and self._hs_key:
+                return pyjwt.decode(
+                    token,
+                    key=self._hs_key,
+                    algorithms=["HS256"],
+                    **self._decode_kwargs,
+                ), True
+            # Try JWKS-based verification (RS*/ES* family)
             if self.jwks_url:
+                # Never trust the token's own alg: reject anything outside the allowlist before any crypto
+                if alg not in self.allowed_algorithms:
+                    logger.warning("Rejected token with disallowed alg=%s", alg)
+                    return None, True
                 # Try to obtain public key for this token
-                public_key = await self._get_public_key_from_jwks(token)
+                public_key = await self._get_public_key_from_jwks(header)
                 if not public_key:
                     logger.warning("Public key not found via JWKS for token")
-                    return None
-                # Prefer to use algorithm from token header
-                try:
-                    header = pyjwt.get_unverified_header(token)
-                    alg = header.get("alg")
-                except Exception:
-                    alg = None
-                algorithms_list = [alg] if alg else ["RS256"]
-
-                decode_kwargs = {}
-                if self.issuer:
-                    decode_kwargs["issuer"] = self.issuer
-                if self.audience:
-                    decode_kwargs["audience"] = self.audience
-
+                    return None, False
                 return pyjwt.decode(
                     token,
                     key=public_key,
-                    algorithms=algorithms_list,
-                    **decode_kwargs,
-                )
-            elif self.secret_key:
+                    algorithms=self._jwks_algorithms_list,
+                    **self._decode_kwargs,
+                ), True
+            elif self._hs_key:
                 # HS256 fallback
-                decode_kwargs = {}
-                if self.issuer:
-                    decode_kwargs["issuer"] = self.issuer
-                if self.audience:
-                    decode_kwargs["audience"] = self.audience
                 return pyjwt.decode(
                     token,
-                    key=self.secret_key,
+                    key=self._hs_key,
                     algorithms=["HS256"],
-                    **decode_kwargs,
-                )
+                    **self._decode_kwargs,
+                ), True
             else:
                 logger.warning("No JWKS URL or secret key configured for JWT verification")
-                return None
+                return None, False
         except pyjwt.ExpiredSignatureError:
             logger.info("Token expired")
-            return None
+            return None, True
         except pyjwt.InvalidTokenError as e:
             logger.warning("Invalid token: %s", e)
-            return None
+            return None, True
+        except pyjwt.PyJWTError as e:
+            # e.g. InvalidKeyError: the key can never verify this token, so it is a rejection too
+            logger.warning("Token rejected: %s", e)
+            return None, True
         except Exception as e:
             logger.exception("Unexpected error while verifying token: %s", e)
-            return None
+            return None, False
 
     async def on_message(self, context: MiddlewareContext, call_next):
         # 1) Optional user-id passthrough from header
         try:
             if self.allow_user_id_header:
-                headers = get_http_headers(include_all=True)
-                user_id = headers.get(self.user_id_header_name)
-                print(f"Extracted user_id from header: {user_id}")
+                user_id = _get_request_header(self.user_id_header_name)
                 if user_id and context.fastmcp_context:
                     logger.debug("Using user-id from header: %s", user_id)
                     context.fastmcp_context.set_state("user_id", user_id)
@@ -211,27 +330,34 @@ class JWTAuthMiddleware(Middleware):
             logger.exception("Error when attempting user-id passthrough from header")
 
         # 2) JWT flow (HS256 or JWKS/RS256)
-        token = self.extract_token_from_context(context)
+        auth_header = _get_request_header("authorization")
+        if not auth_header:
+            # Nothing to verify (health probes, unauthenticated calls): skip straight to the handler
+            logger.debug("No token found in request")
+            return await call_next(context)
+        token = self._parse_bearer(auth_header)
         payload = None
         if token:
             payload = await self.verify_token(token)
             if payload and context.fastmcp_context:
                 user_id = payload.get("sub")
-                print(f"Extracted user_id from JWT: {user_id}")
                 logger.debug("Authenticated user from JWT: %s", user_id)
                 context.fastmcp_context.set_state("user_id", user_id)
                 context.fastmcp_context.set_state("jwt_payload", payload)
         else:
-            logger.debug("No token found in request")
+            logger.debug("Authorization header is not a bearer token")
         try:
             result = await call_next(context)
             return result
+        except ClientDisconnect:
+            # Client went away; nothing worth a traceback
+            raise
         except Exception as e:
             logger.exception("Error in call_next: %s", e)
             raise
 
 
 def extract_user_from_context(ctx: Context) -> Optional[str]:
-    jwt_payload = ctx.get_state("jwt_payload")
-    return jwt_payload.get("sub") if jwt_payload else None
+    # on_message stores the subject directly; no need to re-index the payload
+    return ctx.get_state("user_id")
 
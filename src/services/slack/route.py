@@ -1,58 +1,62 @@
-import aiohttp
-import urllib.parse
+import logging
 from datetime import datetime, timezone
-from fastmcp import FastMCP
-from starlette.responses import JSONResponse
+from starlette.responses import Response
+from src.utils.json_handler import ORJSONResponse, dumps_bytes
 from src.utils.env_handler import SLACK_CLIENT_ID as ENV_SLACK_CLIENT_ID, SLACK_REDIRECT_URI as ENV_SLACK_REDIRECT_URI, SLACK_CLIENT_SECRET as ENV_SLACK_CLIENT_SECRET
-from src.core.storeage_manager import TokenStorageManager
+from src.core.storeage_manager import storageManager
+from src.utils.http_client import get_http_client
 
 slack_client_id = ENV_SLACK_CLIENT_ID
 slack_client_secret = ENV_SLACK_CLIENT_SECRET
 slack_redirect_uri = ENV_SLACK_REDIRECT_URI
 
-slack_mcp_route = FastMCP("Slack Bot MCP Server")
-storageManager=TokenStorageManager()
+logger = logging.getLogger(__name__)
+
+# Static error bodies are serialized once; Response objects themselves are per-request
+_NO_CODE_BODY = dumps_bytes({
+    "error": "No authorization code received",
+    "message": "OAuth callback missing required code parameter"
+})
+_NO_CLIENT_ID_BODY = dumps_bytes({
+    "error": "No JWT client ID found in state parameter",
+    "message": "Invalid OAuth state parameter"
+})
+
 
-@slack_mcp_route.custom_route("/slack/oauth/callback", methods=["GET"])
 async def slack_oauth_callback(request):
     """Handle Slack OAuth callback with JWT client ID mapping"""
     
-    code = request.query_params.get("code")
-    state = request.query_params.get("state")
-    error = request.query_params.get("error")
+    params = request.query_params
+    code = params.get("code")
+    state = params.get("state")
+    error = params.get("error")
 
-    jwt_client_id = state.split(":")[1] if state and ":" in state else None
+    # state is "client_id:<id>"; partition yields "" when there is no separator
+    jwt_client_id = state.partition(":")[2] if state else None
 
     if error:
-        return JSONResponse({
+        return ORJSONResponse({
             "error": f"OAuth authorization failed: {error}",
             "message": "Please try the OAuth flow again"
         }, status_code=400)
     if not code:
-        return JSONResponse({
-            "error": "No authorization code received",
-            "message": "OAuth callback missing required code parameter"
-        }, status_code=400)
+        return Response(_NO_CODE_BODY, status_code=400, media_type="application/json")
     if not jwt_client_id:
-        return JSONResponse({
-            "error": "No JWT client ID found in state parameter",
-            "message": "Invalid OAuth state parameter"
-        }, status_code=400)
+        return Response(_NO_CLIENT_ID_BODY, status_code=400, media_type="application/json")
 
     try:
-        async with aiohttp.ClientSession() as session:
-            data = {
-                "client_id": slack_client_id,
-                "client_secret": slack_client_secret,
-                "code": code,
-                "redirect_uri": slack_redirect_uri
-            }
-            async with session.post("https://slack.com/api/oauth.v2.access", data=data) as response:
-                token_response = await response.json()
+        data = {
+            "client_id": slack_client_id,
+            "client_secret": slack_client_secret,
+            "code": code,
+            "redirect_uri": slack_redirect_uri
+        }
+        response = await get_http_client().post("https://slack.com/api/oauth.v2.access", data=data)
+        token_response = response.json()
 
         if not token_response.get("ok"):
             error_msg = token_response.get("error", "Unknown error")
-            return JSONResponse({
+            return ORJSONResponse({
                 "error": f"OAuth token exchange failed: {error_msg}",
                 "details": token_response,
                 "message": "Please try the OAuth flow again"
@@ -61,7 +65,7 @@ async def slack_oauth_callback(request):
         authed_user = token_response.get("authed_user", {})
         slack_user_id = authed_user.get("id")
         if not slack_user_id:
-            return JSONResponse({
+            return ORJSONResponse({
                 "error": "No user ID received from Slack",
                 "response": token_response,
                 "message": "Invalid response from Slack OAuth"
@@ -87,9 +91,18 @@ async def slack_oauth_callback(request):
             "is_enterprise_install": token_response.get("is_enterprise_install"),
             "mapping_created_at": datetime.now(timezone.utc).isoformat()
         }
-        storageManager.write_token(jwt_client_id, enhanced_token_data)
+        # Persist before reporting success (a single upsert round trip); without a stored token
+        # the tools would keep asking for authorization, so a failed write fails the callback
+        try:
+            await storageManager.write_token(jwt_client_id, enhanced_token_data)
+        except Exception:
+            logger.exception("Failed to store Slack OAuth token for client %s", jwt_client_id)
+            return ORJSONResponse({
+                "error": "Failed to store Slack authorization",
+                "message": "Please try the OAuth flow again"
+            }, status_code=500)
         scopes = token_response.get("scope", "").split(",")
-        return JSONResponse({
+        return ORJSONResponse({
             "success": True,
             "message": f"Successfully authorized! You can now use Slack tools.",
             "jwt_client_id": jwt_client_id,
@@ -104,9 +117,11 @@ async def slack_oauth_callback(request):
             },
             "timestamp": datetime.now(timezone.utc).isoformat()
         })
-    except Exception as e:
-        return JSONResponse({
-            "error": f"OAuth callback failed: {str(e)}",
+    except Exception:
+        # Details stay in the server log; the client only learns that the callback failed
+        logger.exception("Slack OAuth callback failed")
+        return ORJSONResponse({
+            "error": "OAuth callback failed",
             "message": "Please try the OAuth flow again"
         }, status_code=500)
     
@@ -1,7 +1,7 @@
 from typing import Dict, Optional, Any
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SlackResponse:
     """Standard response wrapper for Slack API calls"""
     ok: bool
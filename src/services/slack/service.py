@@ -5,30 +5,109 @@ A wrapper around the official slack-sdk for MCP integration
 
 from slack_sdk.web.async_client import AsyncWebClient
 from slack_sdk.errors import SlackApiError
-from typing import Dict, List, Optional, Union, Any
-from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, Union, Any
+import asyncio
 import logging
+import random
+import time
 import httpx
 import io
+import tempfile
 import os, urllib.parse
 from urllib.parse import urlparse
-from pathlib import Path
 from src.services.slack.schemas.slack import SlackResponse
 from fastmcp import Context
-from src.core.storeage_manager import TokenStorageManager
+from src.core.storeage_manager import storageManager
 from src.middleware.auth import extract_user_from_context
 from fastmcp.server.dependencies import get_context
-from src.utils.env_handler import SLACK_REDIRECT_URI as ENV_SLACK_REDIRECT_URI, SLACK_CLIENT_ID as ENV_SLACK_CLIENT_ID
+from src.utils.env_handler import SLACK_REDIRECT_URI as ENV_SLACK_REDIRECT_URI, SLACK_CLIENT_ID as ENV_SLACK_CLIENT_ID, SLACK_MAX_CONCURRENT_REQUESTS
 from src.utils.config_handler import load_config
+from src.utils.rate_limiter import TokenBucketRegistry
+from src.utils.http_client import get_http_client, get_aiohttp_session
+from src.utils.cache import TTLCache
 
-storageManager = TokenStorageManager()
 logger = logging.getLogger(__name__)
 
+# Authenticated services keyed by access token; a re-authorization yields a new token and a new entry
+_service_cache = TTLCache(maxsize=1000, ttl=3600)
+
+# Web API tokens this service accepts: bot and user tokens, optionally rotated (xoxe.)
+_TOKEN_PREFIXES = ("xoxb-", "xoxp-", "xoxe.xoxb-", "xoxe.xoxp-")
+
+# Errors meaning Slack no longer accepts the token; such tokens are remembered until the
+# stored-token cache would have expired anyway, so callers are sent back through OAuth
+_AUTH_ERRORS = frozenset({"invalid_auth", "not_authed", "token_revoked", "token_expired", "account_inactive"})
+_rejected_tokens = TTLCache(maxsize=1000, ttl=60)
+
+# Client-side pacing mirroring Slack's limits, so concurrent tool calls queue locally
+# instead of collecting 429s. chat.postMessage allows ~1 message/second per channel.
+_post_message_buckets = TokenBucketRegistry(rate=1.0, burst=3)
+
+# Other Web API methods are limited per method and workspace by tier (requests per minute)
+_TIER_PER_MINUTE = {1: 1, 2: 20, 3: 50, 4: 100}
+_tier_buckets = {
+    tier: TokenBucketRegistry(rate=per_minute / 60.0, burst=max(1, per_minute // 4))
+    for tier, per_minute in _TIER_PER_MINUTE.items()
+}
+# Methods not listed here are Tier 3
+_METHOD_TIERS = {
+    "conversations_list": 2, "conversations_create": 2, "conversations_setTopic": 2,
+    "conversations_setPurpose": 2, "conversations_archive": 2, "conversations_unarchive": 2,
+    "users_list": 2, "users_setPresence": 2, "users_info": 4, "users_profile_get": 4,
+    "reactions_remove": 2, "pins_add": 2, "pins_list": 2, "pins_remove": 2,
+    "bookmarks_add": 2, "bookmarks_list": 2, "bookmarks_remove": 2,
+    "emoji_list": 2, "dnd_teamInfo": 2, "files_info": 4, "files_upload_v2": 4,
+    "usergroups_list": 2, "usergroups_create": 2, "usergroups_update": 2, "usergroups_disable": 2,
+}
+# URL downloads are streamed in chunks and capped so one upload cannot exhaust worker memory
+_MAX_DOWNLOAD_BYTES = 100 * 1024 * 1024
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+_DOWNLOAD_SPOOL_BYTES = 1024 * 1024
+
+# Read-only metadata (channel/user info, lists of channels, pins, bookmarks, groups, emoji) changes
+# rarely, so successful lookups are cached briefly per token and identical concurrent lookups share
+# one in-flight request. Team info and profile fields change even less and are kept longer.
+_METADATA_TTL_SECONDS = 60
+_TEAM_METADATA_TTL_SECONDS = 900
+# DND status flips with every snooze, so those lookups are only coalesced, never cached
+_COALESCE_ONLY = 0
+_metadata_cache = TTLCache(maxsize=20000, ttl=_METADATA_TTL_SECONDS)
+_inflight_lookups: Dict[Hashable, "asyncio.Future[SlackResponse]"] = {}
+
+# Transient failures are retried with exponential backoff; auth/validation errors fail fast.
+# Only reads are replayed after a 5xx or server-side error: Slack may already have applied a
+# write before failing, so writes are retried only when Slack rate-limited (rejected) them.
+# Calls that consume their arguments (file streams) are never replayed.
+_RETRYABLE_ERRORS = frozenset({"ratelimited", "service_unavailable", "fatal_error", "internal_error", "request_timeout"})
+_REJECTED_ERRORS = frozenset({"ratelimited"})
+_READ_METHODS = frozenset({
+    "conversations_list", "conversations_info", "conversations_history", "conversations_replies",
+    "users_list", "users_info", "users_profile_get", "files_list", "files_info", "reactions_get",
+    "pins_list", "bookmarks_list", "usergroups_list", "team_info", "team_profile_get",
+    "emoji_list", "dnd_info", "dnd_teamInfo",
+})
+_NO_RETRY_METHODS = frozenset({"files_upload_v2"})
+_MAX_ATTEMPTS = 3
+_BACKOFF_BASE_SECONDS = 0.5
+_BACKOFF_JITTER_SECONDS = 0.25
+
+# The authorize URL depends only on env and config.json, so build everything but the state once
+SLACK_SCOPES: List[str] = load_config().get("slack", {}).get("scopes", [])
+SLACK_OAUTH_BASE_URL = "https://slack.com/oauth/v2/authorize?" + urllib.parse.urlencode({
+    "client_id": ENV_SLACK_CLIENT_ID,
+    "scope": ",".join(SLACK_SCOPES),
+    "redirect_uri": ENV_SLACK_REDIRECT_URI,
+})
+
+
+def _given(**kwargs) -> Dict[str, Any]:
+    """Keep only the optional arguments that were supplied (non-empty)"""
+    return {k: v for k, v in kwargs.items() if v}
+
 
 class SlackBotAPIService:
     @classmethod
     async def from_context(cls, ctx: Context):
-        storageManager = TokenStorageManager()
         jwt_client_id = extract_user_from_context(ctx)
 
         # If there is no client id (JWT missing), instruct to add JWT token
@@ -40,43 +119,43 @@ class SlackBotAPIService:
                 "message": "Add a valid JWT token in the Authorization header: 'Bearer <token>'"
             }
 
-        token_data = storageManager.read_token(jwt_client_id)
+        token_data = await storageManager.read_token(jwt_client_id)
         access_token = token_data.get("access_token") if token_data else None
-        
+        if access_token and access_token in _rejected_tokens:
+            # Force a fresh DB read next time so a re-authorization is picked up immediately
+            storageManager.invalidate(jwt_client_id)
+            access_token = None
+
         if not access_token:
             await ctx.info("No valid Slack OAuth token found. Generating OAuth URL for authorization.")
             # Use the existing get_oauth_url method
-            oauth_data = await cls.get_oauth_url()
+            oauth_data = await cls.get_oauth_url(ctx)
             # Add the requires_auth flag to indicate authentication is needed
             oauth_data["requires_auth"] = True
             return oauth_data
         
-        return cls(access_token)
+        # Reuse the service (and its Slack client) across tool calls for the same token
+        service = _service_cache.get(access_token)
+        if service is None:
+            service = cls(access_token)
+            _service_cache.set(access_token, service)
+        return service
 
     @classmethod
-    async def get_oauth_url(cls):
-        config = load_config().get("slack", {})
-        slack_redirect_uri = ENV_SLACK_REDIRECT_URI
-        slack_client_id = ENV_SLACK_CLIENT_ID
-        ctx = get_context()
-        jwt_payload = ctx.get_state("jwt_payload") if ctx else None
-        jwt_client_id = jwt_payload.get('sub') if jwt_payload else ""
+    async def get_oauth_url(cls, ctx: Optional[Context] = None):
+        # Callers that already hold the context pass it; only fall back to the context lookup otherwise
+        if ctx is None:
+            ctx = get_context()
+        jwt_client_id = (extract_user_from_context(ctx) if ctx else None) or ""
         await ctx.info("Generating OAuth URL")
-        scopes = config.get("scopes", [])
-        scope_string = ",".join(scopes)
-        oauth_url = (
-            f"https://slack.com/oauth/v2/authorize?"
-            f"client_id={slack_client_id}&"
-            f"scope={scope_string}&"
-            f"redirect_uri={urllib.parse.quote(slack_redirect_uri)}&"
-            f"state=client_id:{jwt_client_id}"
-        )
+        state = f"client_id:{jwt_client_id}"
+        oauth_url = f"{SLACK_OAUTH_BASE_URL}&{urllib.parse.urlencode({'state': state})}"
         return {
             "oauth_url": oauth_url,
             "instructions": "Visit this URL to authorize the application with your Slack workspace",
-            "callback_url": slack_redirect_uri,
-            "scopes": scopes,
-            "state": f"client_id:{jwt_client_id}"
+            "callback_url": ENV_SLACK_REDIRECT_URI,
+            "scopes": SLACK_SCOPES,
+            "state": state
         }
     """
     Slack Bot API Service using Official Slack SDK
@@ -88,55 +167,208 @@ class SlackBotAPIService:
         Initialize with bot token using official Slack SDK
         
         Args:
-            bot_token: Slack bot token (xoxb-...)
+            bot_token: Slack bot or user token (xoxb-... / xoxp-...)
         """
-        if not bot_token.startswith('xoxb-'):
-            raise ValueError("Bot token must start with 'xoxb-'")
+        if not bot_token or not bot_token.startswith(_TOKEN_PREFIXES):
+            raise ValueError("Token must be a Slack bot (xoxb-) or user (xoxp-) token")
         
         self.bot_token = bot_token
-        self.client = AsyncWebClient(token=bot_token)
+        # Share the process-wide aiohttp session so calls reuse pooled keep-alive
+        # connections to slack.com; the SDK falls back to a one-off session if it is closed
+        self.client = AsyncWebClient(token=bot_token, session=get_aiohttp_session())
+        # Bound client methods by name, filled on first use so repeat calls skip attribute lookup
+        self._methods: Dict[str, Any] = {}
+        # Part of every channel-list cache key; bumped when a channel changes so old lists are skipped
+        self._channel_list_version = 0
     
     def _handle_response(self, response) -> SlackResponse:
         """Convert Slack SDK response to our standard format"""
+        # Read the parsed body once instead of going through the response's get() proxy per field
+        data = response.data
         return SlackResponse(
-            ok=response.get("ok", False),
-            data=response.data,
-            error=response.get("error"),
-            warning=response.get("warning")
+            ok=data.get("ok", False),
+            data=data,
+            error=data.get("error"),
+            warning=data.get("warning")
         )
     
+    def _rate_limit_bucket(self, method_name: str, channel: Optional[str]):
+        """Token bucket for this call: per channel for chat.postMessage, per method otherwise"""
+        if method_name == "chat_postMessage" and channel:
+            return _post_message_buckets.get((self.bot_token, channel))
+        tier = _METHOD_TIERS.get(method_name, 3)
+        return _tier_buckets[tier].get((self.bot_token, method_name))
+
     async def _safe_api_call(self, method_name: str, **kwargs) -> SlackResponse:
-        """Safely call Slack API with error handling"""
+        """Safely call Slack API with client-side pacing and error handling"""
+        bucket = self._rate_limit_bucket(method_name, kwargs.get("channel"))
+        attempts = 1 if method_name in _NO_RETRY_METHODS else _MAX_ATTEMPTS
+        replay_safe = method_name in _READ_METHODS
+        retry_errors = _RETRYABLE_ERRORS if replay_safe else _REJECTED_ERRORS
         try:
-            method = getattr(self.client, method_name)
-            response = await method(**kwargs)
-            return self._handle_response(response)
+            method = self._methods.get(method_name)
+            if method is None:
+                method = self._methods[method_name] = getattr(self.client, method_name)
+            for attempt in range(1, attempts + 1):
+                await bucket.acquire()
+                try:
+                    response = await method(**kwargs)
+                    return self._handle_response(response)
+                except SlackApiError as e:
+                    status = e.response.status_code
+                    if status == 429:
+                        # Hold everyone sharing this bucket until Retry-After, even on the last attempt
+                        delay = self._retry_after(e.response) + random.uniform(0, _BACKOFF_JITTER_SECONDS)
+                        bucket.drain_until(time.monotonic() + delay)
+                    elif (replay_safe and status >= 500) or e.response.get("error") in retry_errors:
+                        delay = _BACKOFF_BASE_SECONDS * 2 ** (attempt - 1) + random.uniform(0, _BACKOFF_JITTER_SECONDS)
+                    else:
+                        raise
+                    if attempt == attempts:
+                        raise
+                    logger.warning("Slack call %s failed (%s); retry %d in %.2fs",
+                                   method_name, e.response.get("error"), attempt, delay)
+                    if status != 429:
+                        await asyncio.sleep(delay)
         except SlackApiError as e:
-            logger.error(f"Slack API Error in {method_name}: {e.response['error']}")
+            logger.error("Slack API Error in %s: %s", method_name, e.response['error'])
+            if e.response["error"] in _AUTH_ERRORS:
+                _service_cache.pop(self.bot_token, None)
+                _rejected_tokens.set(self.bot_token, True)
             return SlackResponse(
                 ok=False,
                 data=e.response,
                 error=e.response["error"]
             )
         except Exception as e:
-            logger.error(f"Unexpected error in {method_name}: {str(e)}")
+            logger.error("Unexpected error in %s: %s", method_name, e)
             return SlackResponse(
                 ok=False,
                 data={},
                 error=str(e)
             )
     
+    async def _paginate(
+        self,
+        method_name: str,
+        items_key: str,
+        max_pages: int,
+        dedupe_key: Optional[str] = None,
+        **kwargs
+    ) -> SlackResponse:
+        """Call a cursor-paginated method, following next_cursor for up to ``max_pages`` pages.
+
+        Slack cursors are chained, so pages are fetched one after another. The merged response
+        keeps the last page's metadata (next_cursor, has_more) so the caller can resume; if a
+        later page fails, the items gathered so far are returned with the error as a warning.
+        """
+        result = await self._safe_api_call(method_name, **kwargs)
+        if max_pages <= 1 or not result.ok:
+            return result
+        data = result.data
+        items = list(data.get(items_key, ()))
+        seen = {item.get(dedupe_key) for item in items} if dedupe_key else None
+        warning = result.warning
+        for _ in range(max_pages - 1):
+            cursor = (data.get("response_metadata") or {}).get("next_cursor")
+            if not cursor:
+                break
+            page = await self._safe_api_call(method_name, **{**kwargs, "cursor": cursor})
+            if not page.ok:
+                warning = f"stopped after {len(items)} items: {page.error}"
+                break
+            data = page.data
+            for item in data.get(items_key, ()):
+                if seen is not None:
+                    key = item.get(dedupe_key)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                items.append(item)
+        merged = dict(data)
+        merged[items_key] = items
+        return SlackResponse(ok=True, data=merged, warning=warning)
+
+    async def _cached_lookup(
+        self,
+        key: Hashable,
+        call: Callable[[], Awaitable[SlackResponse]],
+        ttl: Optional[float] = None
+    ) -> SlackResponse:
+        """Serve a read-only lookup from the metadata cache, joining an identical call in flight.
+
+        Only successful responses are cached; a ``ttl`` of 0 just joins calls in flight. The shared
+        call runs as its own task, so a caller being cancelled does not cancel it for the others
+        waiting on it.
+        """
+        cached = _metadata_cache.get(key)
+        if cached is not None:
+            return cached
+        task = _inflight_lookups.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            _inflight_lookups[key] = task
+
+            def _store(done: "asyncio.Future[SlackResponse]") -> None:
+                # A lookup invalidated while in flight is no longer registered; drop its result
+                if _inflight_lookups.get(key) is not done:
+                    return
+                del _inflight_lookups[key]
+                if not done.cancelled() and done.exception() is None and done.result().ok:
+                    _metadata_cache.set(key, done.result(), ttl)
+
+            task.add_done_callback(_store)
+        return await asyncio.shield(task)
+
+    def _forget(self, *keys: Hashable) -> None:
+        """Drop cached lookups (and detach any in flight) for this token's ``keys``"""
+        for key in keys:
+            key = (self.bot_token, *key)
+            _metadata_cache.pop(key, None)
+            _inflight_lookups.pop(key, None)
+
+    def _forget_channel(self, channel: Optional[str] = None) -> None:
+        """Drop cached metadata made stale by a change to ``channel`` (or to the channel set)"""
+        self._channel_list_version += 1
+        if channel:
+            self._forget(("conversations_info", channel))
+
+    def _forget_usergroups(self) -> None:
+        """Drop both cached user group lists (with and without disabled groups)"""
+        self._forget(("usergroups_list", False), ("usergroups_list", True))
+
+    async def _channel_update(self, method_name: str, channel: str, **kwargs) -> SlackResponse:
+        """Call a channel-modifying method and invalidate the channel's cached metadata"""
+        result = await self._safe_api_call(method_name, channel=channel, **kwargs)
+        if result.ok:
+            self._forget_channel(channel)
+        return result
+
+    @staticmethod
+    def _retry_after(response, default: float = 1.0) -> float:
+        """Seconds to back off after a 429, taken from the Retry-After header when present"""
+        headers = getattr(response, "headers", None) or {}
+        value = headers.get("Retry-After") or headers.get("retry-after")
+        try:
+            return float(value) if value is not None else default
+        except (TypeError, ValueError):
+            return default
+
     def _is_url(self, path: str) -> bool:
         """Check if the given string is a URL"""
+        # A netloc needs "scheme://"; plain paths and text content never reach urlparse
+        if not isinstance(path, str) or "://" not in path:
+            return False
         try:
             result = urlparse(path)
-            return all([result.scheme, result.netloc])
-        except:
+        except ValueError:
             return False
+        return bool(result.scheme and result.netloc)
     
     def _is_file_path(self, path: str) -> bool:
         """Check if the given string is a valid file path"""
-        return os.path.isfile(path) or Path(path).exists()
+        # One stat call; directories are not uploadable so they fall through to text content
+        return os.path.isfile(path)
     
     
 
@@ -153,24 +385,25 @@ class SlackBotAPIService:
         icon_url: Optional[str] = None
     ) -> SlackResponse:
         """Send a message to a channel"""
-        kwargs = {"channel": channel}
-        
-        if text:
-            kwargs["text"] = text
-        if blocks:
-            kwargs["blocks"] = blocks
-        if attachments:
-            kwargs["attachments"] = attachments
-        if thread_ts:
-            kwargs["thread_ts"] = thread_ts
-        if username:
-            kwargs["username"] = username
-        if icon_emoji:
-            kwargs["icon_emoji"] = icon_emoji
-        if icon_url:
-            kwargs["icon_url"] = icon_url
-            
-        return await self._safe_api_call("chat_postMessage", **kwargs)
+        kwargs = _given(
+            text=text, blocks=blocks, attachments=attachments, thread_ts=thread_ts,
+            username=username, icon_emoji=icon_emoji, icon_url=icon_url,
+        )
+        return await self._safe_api_call("chat_postMessage", channel=channel, **kwargs)
+
+    async def send_messages_bulk(self, messages: List[Dict[str, Any]]) -> List[SlackResponse]:
+        """Send several messages concurrently; each dict holds send_message arguments.
+
+        At most SLACK_MAX_CONCURRENT_REQUESTS sends are in flight and per-channel pacing
+        still applies. Results are returned in input order.
+        """
+        semaphore = asyncio.Semaphore(SLACK_MAX_CONCURRENT_REQUESTS)
+
+        async def _send(message: Dict[str, Any]) -> SlackResponse:
+            async with semaphore:
+                return await self.send_message(**message)
+
+        return await asyncio.gather(*(_send(message) for message in messages))
     
     async def update_message(
         self,
@@ -181,16 +414,8 @@ class SlackBotAPIService:
         attachments: Optional[List[Dict]] = None
     ) -> SlackResponse:
         """Update an existing message"""
-        kwargs = {"channel": channel, "ts": ts}
-        
-        if text:
-            kwargs["text"] = text
-        if blocks:
-            kwargs["blocks"] = blocks
-        if attachments:
-            kwargs["attachments"] = attachments
-            
-        return await self._safe_api_call("chat_update", **kwargs)
+        kwargs = _given(text=text, blocks=blocks, attachments=attachments)
+        return await self._safe_api_call("chat_update", channel=channel, ts=ts, **kwargs)
     
     async def delete_message(self, channel: str, ts: str) -> SlackResponse:
         """Delete a message"""
@@ -205,16 +430,8 @@ class SlackBotAPIService:
         attachments: Optional[List[Dict]] = None
     ) -> SlackResponse:
         """Schedule a message to be sent later"""
-        kwargs = {"channel": channel, "post_at": post_at}
-        
-        if text:
-            kwargs["text"] = text
-        if blocks:
-            kwargs["blocks"] = blocks
-        if attachments:
-            kwargs["attachments"] = attachments
-            
-        return await self._safe_api_call("chat_scheduleMessage", **kwargs)
+        kwargs = _given(text=text, blocks=blocks, attachments=attachments)
+        return await self._safe_api_call("chat_scheduleMessage", channel=channel, post_at=post_at, **kwargs)
 
     # ==================== CHANNELS ====================
     
@@ -223,9 +440,10 @@ class SlackBotAPIService:
         exclude_archived: bool = True,
         limit: int = 100,
         cursor: Optional[str] = None,
-        types: str = "public_channel,private_channel"
+        types: str = "public_channel,private_channel",
+        max_pages: int = 1
     ) -> SlackResponse:
-        """List all channels"""
+        """List all channels, following up to ``max_pages`` pages"""
         kwargs = {
             "exclude_archived": exclude_archived,
             "limit": limit,
@@ -234,11 +452,18 @@ class SlackBotAPIService:
         if cursor:
             kwargs["cursor"] = cursor
             
-        return await self._safe_api_call("conversations_list", **kwargs)
+        key = (self.bot_token, "conversations_list", self._channel_list_version,
+               exclude_archived, limit, cursor, types, max_pages)
+        return await self._cached_lookup(
+            key, lambda: self._paginate("conversations_list", "channels", max_pages, **kwargs)
+        )
     
     async def get_channel_info(self, channel: str) -> SlackResponse:
         """Get information about a channel"""
-        return await self._safe_api_call("conversations_info", channel=channel)
+        return await self._cached_lookup(
+            (self.bot_token, "conversations_info", channel),
+            lambda: self._safe_api_call("conversations_info", channel=channel),
+        )
     
     async def create_channel(
         self,
@@ -246,41 +471,44 @@ class SlackBotAPIService:
         is_private: bool = False
     ) -> SlackResponse:
         """Create a new channel"""
-        return await self._safe_api_call("conversations_create", name=name, is_private=is_private)
+        result = await self._safe_api_call("conversations_create", name=name, is_private=is_private)
+        if result.ok:
+            self._forget_channel()
+        return result
     
     async def join_channel(self, channel: str) -> SlackResponse:
         """Join a channel"""
-        return await self._safe_api_call("conversations_join", channel=channel)
+        return await self._channel_update("conversations_join", channel)
     
     async def leave_channel(self, channel: str) -> SlackResponse:
         """Leave a channel"""
-        return await self._safe_api_call("conversations_leave", channel=channel)
+        return await self._channel_update("conversations_leave", channel)
     
     async def invite_to_channel(self, channel: str, users: Union[str, List[str]]) -> SlackResponse:
         """Invite users to a channel"""
         if isinstance(users, list):
             users = ",".join(users)
-        return await self._safe_api_call("conversations_invite", channel=channel, users=users)
+        return await self._channel_update("conversations_invite", channel, users=users)
     
     async def kick_from_channel(self, channel: str, user: str) -> SlackResponse:
         """Remove a user from a channel"""
-        return await self._safe_api_call("conversations_kick", channel=channel, user=user)
+        return await self._channel_update("conversations_kick", channel, user=user)
     
     async def set_channel_topic(self, channel: str, topic: str) -> SlackResponse:
         """Set channel topic"""
-        return await self._safe_api_call("conversations_setTopic", channel=channel, topic=topic)
+        return await self._channel_update("conversations_setTopic", channel, topic=topic)
     
     async def set_channel_purpose(self, channel: str, purpose: str) -> SlackResponse:
         """Set channel purpose"""
-        return await self._safe_api_call("conversations_setPurpose", channel=channel, purpose=purpose)
+        return await self._channel_update("conversations_setPurpose", channel, purpose=purpose)
     
     async def archive_channel(self, channel: str) -> SlackResponse:
         """Archive a channel"""
-        return await self._safe_api_call("conversations_archive", channel=channel)
+        return await self._channel_update("conversations_archive", channel)
     
     async def unarchive_channel(self, channel: str) -> SlackResponse:
         """Unarchive a channel"""
-        return await self._safe_api_call("conversations_unarchive", channel=channel)
+        return await self._channel_update("conversations_unarchive", channel)
 
     # ==================== CHANNEL HISTORY ====================
     
@@ -290,9 +518,10 @@ class SlackBotAPIService:
         limit: int = 100,
         cursor: Optional[str] = None,
         latest: Optional[str] = None,
-        oldest: Optional[str] = None
+        oldest: Optional[str] = None,
+        max_pages: int = 1
     ) -> SlackResponse:
-        """Get channel message history"""
+        """Get channel message history, following up to ``max_pages`` pages"""
         kwargs = {"channel": channel, "limit": limit}
         
         if cursor:
@@ -302,44 +531,53 @@ class SlackBotAPIService:
         if oldest:
             kwargs["oldest"] = oldest
             
-        return await self._safe_api_call("conversations_history", **kwargs)
+        return await self._paginate("conversations_history", "messages", max_pages, **kwargs)
     
     async def get_thread_replies(
         self,
         channel: str,
         ts: str,
         limit: int = 100,
-        cursor: Optional[str] = None
+        cursor: Optional[str] = None,
+        max_pages: int = 1
     ) -> SlackResponse:
-        """Get replies to a threaded message"""
+        """Get replies to a threaded message, following up to ``max_pages`` pages"""
         kwargs = {"channel": channel, "ts": ts, "limit": limit}
         
         if cursor:
             kwargs["cursor"] = cursor
             
-        return await self._safe_api_call("conversations_replies", **kwargs)
+        # Every replies page repeats the parent message, so merge pages by ts
+        return await self._paginate("conversations_replies", "messages", max_pages, dedupe_key="ts", **kwargs)
 
     # ==================== USERS ====================
     
     async def list_users(
         self,
         limit: int = 100,
-        cursor: Optional[str] = None
+        cursor: Optional[str] = None,
+        max_pages: int = 1
     ) -> SlackResponse:
-        """List all users in workspace"""
+        """List all users in workspace, following up to ``max_pages`` pages"""
         kwargs = {"limit": limit}
         if cursor:
             kwargs["cursor"] = cursor
             
-        return await self._safe_api_call("users_list", **kwargs)
+        return await self._paginate("users_list", "members", max_pages, **kwargs)
     
     async def get_user_info(self, user: str) -> SlackResponse:
         """Get information about a user"""
-        return await self._safe_api_call("users_info", user=user)
+        return await self._cached_lookup(
+            (self.bot_token, "users_info", user),
+            lambda: self._safe_api_call("users_info", user=user),
+        )
     
     async def get_user_profile(self, user: str) -> SlackResponse:
         """Get user's profile information"""
-        return await self._safe_api_call("users_profile_get", user=user)
+        return await self._cached_lookup(
+            (self.bot_token, "users_profile_get", user),
+            lambda: self._safe_api_call("users_profile_get", user=user),
+        )
     
     async def set_user_presence(self, presence: str) -> SlackResponse:
         """Set bot's presence (auto or away)"""
@@ -354,7 +592,8 @@ class SlackBotAPIService:
         filename: Optional[str] = None,
         title: Optional[str] = None,
         initial_comment: Optional[str] = None,
-        thread_ts: Optional[str] = None
+        thread_ts: Optional[str] = None,
+        max_bytes: Optional[int] = None
     ) -> SlackResponse:
         """
         Dynamic file upload - automatically detects if source is URL, file path, or content
@@ -366,18 +605,21 @@ class SlackBotAPIService:
             title: File title
             initial_comment: Comment to add with file
             thread_ts: Thread timestamp if uploading to thread
+            max_bytes: Size limit for URL downloads (defaults to 100 MiB)
         """
-        if isinstance(channels, list):
-            channels = ",".join(channels)
+        # Checked before any download or read so an upload is never left unshared
+        destination = self._upload_destination(channels)
+        if destination is None:
+            return SlackResponse(ok=False, data={}, error="no channel given")
         
         # Auto-detect source type and route to appropriate method
         if self._is_url(file_source):
             return await self._upload_from_url(
-                channels, file_source, filename, title, initial_comment, thread_ts
+                destination, file_source, filename, title, initial_comment, thread_ts, max_bytes
             )
         elif self._is_file_path(file_source):
             return await self._upload_from_path(
-                channels, file_source, filename, title, initial_comment, thread_ts
+                destination, file_source, filename, title, initial_comment, thread_ts
             )
         else:
             # Treat as text content
@@ -388,24 +630,56 @@ class SlackBotAPIService:
                     error="filename is required when uploading text content"
                 )
             return await self._upload_content(
-                channels, file_source, filename, title, initial_comment, thread_ts
+                destination, file_source, filename, title, initial_comment, thread_ts
             )
     
+    @staticmethod
+    def _upload_destination(channels: Union[str, List[str]]) -> Optional[Dict[str, Any]]:
+        """files_upload_v2 arguments for the target channel(s), or None when no channel is given
+
+        One channel goes in ``channel``; several go in ``channels`` so the single
+        files.completeUploadExternal call shares the file to all of them at once.
+        """
+        if isinstance(channels, str):
+            channels = channels.split(",")
+        channels = [c.strip() for c in channels if c and c.strip()]
+        if not channels:
+            return None
+        if len(channels) == 1:
+            return {"channel": channels[0]}
+        return {"channels": channels}
+
     async def _upload_from_url(
         self,
-        channels: str,
+        destination: Dict[str, Any],
         file_url: str,
         filename: Optional[str],
         title: Optional[str],
         initial_comment: Optional[str],
-        thread_ts: Optional[str]
+        thread_ts: Optional[str],
+        max_bytes: Optional[int] = None
     ) -> SlackResponse:
         """Download file from URL and upload to Slack"""
+        limit = max_bytes or _MAX_DOWNLOAD_BYTES
+        too_large = SlackResponse(ok=False, data={}, error=f"File at URL exceeds the {limit} byte limit")
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(file_url)
-                response.raise_for_status()
-                
+            # The body is spooled to a temp file past _DOWNLOAD_SPOOL_BYTES, so the only full
+            # in-memory copy of a large download is the one the SDK reads for the upload
+            with tempfile.SpooledTemporaryFile(max_size=_DOWNLOAD_SPOOL_BYTES) as spool:
+                async with get_http_client().stream("GET", file_url) as response:
+                    response.raise_for_status()
+                    # Reject up front when the server declares the size, before reading any of the body
+                    declared = response.headers.get("content-length", "")
+                    if declared.isdigit() and int(declared) > limit:
+                        return too_large
+                    size = 0
+                    async for chunk in response.aiter_bytes(_DOWNLOAD_CHUNK_SIZE):
+                        size += len(chunk)
+                        if size > limit:
+                            return too_large
+                        spool.write(chunk)
+                spool.seek(0)
+            
                 # Get filename from URL if not provided
                 if not filename:
                     parsed_url = urlparse(file_url)
@@ -419,28 +693,25 @@ class SlackBotAPIService:
                             filename = "downloaded_image.jpg"
                         else:
                             filename = "downloaded_file"
-                
-                # Create file-like object from downloaded content
-                file_data = io.BytesIO(response.content)
-                
+            
                 kwargs = {
-                    "channel": channels,
-                    "file": file_data,
+                    **destination,
+                    "file": spool,
                     "filename": filename
                 }
-                
+            
                 if title:
                     kwargs["title"] = title
                 else:
                     kwargs["title"] = f"File from {file_url}"
-                    
+                
                 if initial_comment:
                     kwargs["initial_comment"] = initial_comment
                 if thread_ts:
                     kwargs["thread_ts"] = thread_ts
-                
+            
                 return await self._safe_api_call("files_upload_v2", **kwargs)
-                
+            
         except httpx.HTTPError as e:
             return SlackResponse(
                 ok=False,
@@ -456,7 +727,7 @@ class SlackBotAPIService:
     
     async def _upload_from_path(
         self,
-        channels: str,
+        destination: Dict[str, Any],
         file_path: str,
         filename: Optional[str],
         title: Optional[str],
@@ -469,7 +740,7 @@ class SlackBotAPIService:
                 filename = os.path.basename(file_path)
             
             kwargs = {
-                "channel": channels,
+                **destination,
                 "file": file_path,
                 "filename": filename
             }
@@ -495,7 +766,7 @@ class SlackBotAPIService:
     
     async def _upload_content(
         self,
-        channels: str,
+        destination: Dict[str, Any],
         content: str,
         filename: str,
         title: Optional[str],
@@ -508,7 +779,7 @@ class SlackBotAPIService:
             file_data = io.BytesIO(content.encode('utf-8'))
             
             kwargs = {
-                "channel": channels,
+                **destination,
                 "file": file_data,
                 "filename": filename
             }
@@ -540,10 +811,11 @@ class SlackBotAPIService:
         filename: Optional[str] = None,
         title: Optional[str] = None,
         initial_comment: Optional[str] = None,
-        thread_ts: Optional[str] = None
+        thread_ts: Optional[str] = None,
+        max_bytes: Optional[int] = None
     ) -> SlackResponse:
         """Upload file from URL (explicit method)"""
-        return await self.upload_file(channels, file_url, filename, title, initial_comment, thread_ts)
+        return await self.upload_file(channels, file_url, filename, title, initial_comment, thread_ts, max_bytes)
     
     async def upload_file_from_path(
         self,
@@ -577,9 +849,17 @@ class SlackBotAPIService:
         ts_to: Optional[str] = None,
         types: Optional[str] = None,
         count: int = 100,
-        page: int = 1
+        page: int = 1,
+        max_pages: int = 1
     ) -> SlackResponse:
-        """List files in workspace"""
+        """List files in workspace, fetching up to ``max_pages`` pages starting at ``page``
+
+        files.list pages by number rather than by cursor, so once the first page reports the
+        page count the remaining pages are requested concurrently (paced by the rate limiter).
+        The merged response's ``paging.page`` is the last page included, so the caller can
+        resume from the next one; if a page fails, the files before it are returned with the
+        error as a warning.
+        """
         kwargs = {"count": count, "page": page}
         
         if user:
@@ -593,7 +873,31 @@ class SlackBotAPIService:
         if types:
             kwargs["types"] = types
             
-        return await self._safe_api_call("files_list", **kwargs)
+        result = await self._safe_api_call("files_list", **kwargs)
+        if max_pages <= 1 or not result.ok:
+            return result
+        data = result.data
+        paging = data.get("paging") or {}
+        last_page = min(paging.get("pages", page), page + max_pages - 1)
+        if last_page <= page:
+            return result
+        pages = await asyncio.gather(*(
+            self._safe_api_call("files_list", **{**kwargs, "page": number})
+            for number in range(page + 1, last_page + 1)
+        ))
+        files = list(data.get("files", ()))
+        warning = result.warning
+        included = page
+        for response in pages:
+            if not response.ok:
+                warning = f"stopped after {len(files)} files: {response.error}"
+                break
+            files.extend(response.data.get("files", ()))
+            included += 1
+        merged = dict(data)
+        merged["files"] = files
+        merged["paging"] = {**paging, "page": included}
+        return SlackResponse(ok=True, data=merged, warning=warning)
     
     async def get_file_info(self, file: str) -> SlackResponse:
         """Get information about a file"""
@@ -621,15 +925,24 @@ class SlackBotAPIService:
     
     async def pin_message(self, channel: str, timestamp: str) -> SlackResponse:
         """Pin a message to channel"""
-        return await self._safe_api_call("pins_add", channel=channel, timestamp=timestamp)
+        result = await self._safe_api_call("pins_add", channel=channel, timestamp=timestamp)
+        if result.ok:
+            self._forget(("pins_list", channel))
+        return result
     
     async def unpin_message(self, channel: str, timestamp: str) -> SlackResponse:
         """Unpin a message from channel"""
-        return await self._safe_api_call("pins_remove", channel=channel, timestamp=timestamp)
+        result = await self._safe_api_call("pins_remove", channel=channel, timestamp=timestamp)
+        if result.ok:
+            self._forget(("pins_list", channel))
+        return result
     
     async def list_pins(self, channel: str) -> SlackResponse:
         """List pinned items in channel"""
-        return await self._safe_api_call("pins_list", channel=channel)
+        return await self._cached_lookup(
+            (self.bot_token, "pins_list", channel),
+            lambda: self._safe_api_call("pins_list", channel=channel),
+        )
 
     # ==================== BOOKMARKS ====================
     
@@ -652,15 +965,24 @@ class SlackBotAPIService:
         if emoji:
             kwargs["emoji"] = emoji
             
-        return await self._safe_api_call("bookmarks_add", **kwargs)
+        result = await self._safe_api_call("bookmarks_add", **kwargs)
+        if result.ok:
+            self._forget(("bookmarks_list", channel_id))
+        return result
     
     async def remove_bookmark(self, channel_id: str, bookmark_id: str) -> SlackResponse:
         """Remove a bookmark from channel"""
-        return await self._safe_api_call("bookmarks_remove", channel_id=channel_id, bookmark_id=bookmark_id)
+        result = await self._safe_api_call("bookmarks_remove", channel_id=channel_id, bookmark_id=bookmark_id)
+        if result.ok:
+            self._forget(("bookmarks_list", channel_id))
+        return result
     
     async def list_bookmarks(self, channel_id: str) -> SlackResponse:
         """List bookmarks in channel"""
-        return await self._safe_api_call("bookmarks_list", channel_id=channel_id)
+        return await self._cached_lookup(
+            (self.bot_token, "bookmarks_list", channel_id),
+            lambda: self._safe_api_call("bookmarks_list", channel_id=channel_id),
+        )
 
     # ==================== USER GROUPS ====================
     
@@ -681,11 +1003,17 @@ class SlackBotAPIService:
         if channels:
             kwargs["channels"] = ",".join(channels)
             
-        return await self._safe_api_call("usergroups_create", **kwargs)
+        result = await self._safe_api_call("usergroups_create", **kwargs)
+        if result.ok:
+            self._forget_usergroups()
+        return result
     
     async def list_usergroups(self, include_disabled: bool = False) -> SlackResponse:
         """List user groups"""
-        return await self._safe_api_call("usergroups_list", include_disabled=include_disabled)
+        return await self._cached_lookup(
+            (self.bot_token, "usergroups_list", include_disabled),
+            lambda: self._safe_api_call("usergroups_list", include_disabled=include_disabled),
+        )
     
     async def update_usergroup(
         self,
@@ -704,27 +1032,44 @@ class SlackBotAPIService:
         if description:
             kwargs["description"] = description
             
-        return await self._safe_api_call("usergroups_update", **kwargs)
+        result = await self._safe_api_call("usergroups_update", **kwargs)
+        if result.ok:
+            self._forget_usergroups()
+        return result
     
     async def disable_usergroup(self, usergroup: str) -> SlackResponse:
         """Disable a user group"""
-        return await self._safe_api_call("usergroups_disable", usergroup=usergroup)
+        result = await self._safe_api_call("usergroups_disable", usergroup=usergroup)
+        if result.ok:
+            self._forget_usergroups()
+        return result
 
     # ==================== TEAM INFO ====================
     
     async def get_team_info(self) -> SlackResponse:
         """Get team information"""
-        return await self._safe_api_call("team_info")
+        return await self._cached_lookup(
+            (self.bot_token, "team_info"),
+            lambda: self._safe_api_call("team_info"),
+            _TEAM_METADATA_TTL_SECONDS,
+        )
     
     async def get_team_profile(self) -> SlackResponse:
         """Get team profile fields"""
-        return await self._safe_api_call("team_profile_get")
+        return await self._cached_lookup(
+            (self.bot_token, "team_profile_get"),
+            lambda: self._safe_api_call("team_profile_get"),
+            _TEAM_METADATA_TTL_SECONDS,
+        )
 
     # ==================== EMOJI ====================
     
     async def list_emoji(self) -> SlackResponse:
         """List custom emoji for team"""
-        return await self._safe_api_call("emoji_list")
+        return await self._cached_lookup(
+            (self.bot_token, "emoji_list"),
+            lambda: self._safe_api_call("emoji_list"),
+        )
 
     # ==================== DND (Do Not Disturb) ====================
     
@@ -734,7 +1079,11 @@ class SlackBotAPIService:
         if user:
             kwargs["user"] = user
             
-        return await self._safe_api_call("dnd_info", **kwargs)
+        return await self._cached_lookup(
+            (self.bot_token, "dnd_info", user),
+            lambda: self._safe_api_call("dnd_info", **kwargs),
+            _COALESCE_ONLY,
+        )
     
     async def get_dnd_team_info(self, users: Optional[List[str]] = None) -> SlackResponse:
         """Get DND info for multiple users"""
@@ -742,4 +1091,9 @@ class SlackBotAPIService:
         if users:
             kwargs["users"] = ",".join(users)
             
-        return await self._safe_api_call("dnd_teamInfo", **kwargs)
\ No newline at end of file
+        # The response maps user ids to status, so the same set in any order is the same lookup
+        return await self._cached_lookup(
+            (self.bot_token, "dnd_teamInfo", frozenset(users or ())),
+            lambda: self._safe_api_call("dnd_teamInfo", **kwargs),
+            _COALESCE_ONLY,
+        )
\ No newline at end of file
@@ -1,30 +1,21 @@
-import os
+import functools
+import inspect
 import logging
-import aiohttp
-import urllib.parse
-from pathlib import Path
 from fastmcp import FastMCP, Context
-from typing import List, Optional, Dict, Any, Union
+from types import MappingProxyType
+from typing import List, Optional, Dict, Any, Union, Mapping
 from pydantic import Field
-from datetime import datetime, timezone
 from typing_extensions import Annotated
-from starlette.responses import JSONResponse
 from src.middleware.auth import JWTAuthMiddleware, extract_user_from_context
-from src.core.storeage_manager import TokenStorageManager
-from src.services.slack.service import SlackBotAPIService
-from src.utils.env_handler import SLACK_CLIENT_ID as ENV_SLACK_CLIENT_ID, SLACK_REDIRECT_URI as ENV_SLACK_REDIRECT_URI, SLACK_CLIENT_SECRET as ENV_SLACK_CLIENT_SECRET
+from src.core.storeage_manager import storageManager
+from src.services.slack.service import SlackBotAPIService, SLACK_OAUTH_BASE_URL
 from src.utils.env_handler import JWT_ISSUER as ENV_JWT_ISSUER, JWT_AUDIENCE as ENV_JWT_AUDIENCE
+from src.utils.json_handler import tool_serializer
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-slack_client_id = ENV_SLACK_CLIENT_ID
-slack_client_secret = ENV_SLACK_CLIENT_SECRET
-slack_redirect_uri = ENV_SLACK_REDIRECT_URI
-
 # Create MCP instance WITHOUT built-in auth
-mcp = FastMCP("Slack Bot MCP Server")
-storageManager=TokenStorageManager()
+mcp = FastMCP("Slack Bot MCP Server", tool_serializer=tool_serializer)
 
 mcp.add_middleware(JWTAuthMiddleware(
         issuer=ENV_JWT_ISSUER,
@@ -43,10 +34,35 @@ async def _get_slack_service(ctx: Context):
     return slack_service, False
 
 
+def slack_tool(fn):
+    """Register an MCP tool whose first parameter receives the caller's SlackBotAPIService.
+
+    That parameter is hidden from the tool schema. When the caller still has to authorize,
+    the OAuth instructions are returned instead of running the tool body.
+    """
+    signature = inspect.signature(fn)
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        slack_service, needs_auth = await _get_slack_service(kwargs.get("ctx"))
+        if needs_auth:
+            return slack_service
+        return await fn(slack_service, *args, **kwargs)
+
+    wrapper.__signature__ = signature.replace(parameters=list(signature.parameters.values())[1:])
+    return mcp.tool(wrapper)
+
+
+async def _failure(ctx: Context, message: str, result) -> Dict[str, Any]:
+    """Report a failed Slack call to the client and build the standard error payload"""
+    await ctx.error(f"{message}: {result.error}")
+    return {"success": False, "error": result.error}
+
+
 @mcp.tool
 async def get_oauth_url(ctx: Context = None) -> Dict[str, Any]:
     """Get the OAuth URL for Slack authorization"""
-    return await SlackBotAPIService.get_oauth_url()
+    return await SlackBotAPIService.get_oauth_url(ctx)
 
 @mcp.tool
 async def check_oauth_status(ctx: Context = None) -> Dict[str, Any]:
@@ -55,25 +71,41 @@ async def check_oauth_status(ctx: Context = None) -> Dict[str, Any]:
     
     try:
         user_id = extract_user_from_context(ctx)
-        token_data = storageManager.read_token(user_id)
+
+        # Issuers that embed the Slack authorization in the JWT let us answer without a DB read
+        jwt_payload = ctx.get_state("jwt_payload") or {}
+        if jwt_payload.get("slack_authorized"):
+            scope = jwt_payload.get("scope") or []
+            await ctx.info(f"OAuth status taken from JWT claims for user: {user_id}")
+            return {
+                "authorized": True,
+                "user_id": user_id,
+                "team_name": jwt_payload.get("team_name"),
+                "team_id": jwt_payload.get("team_id"),
+                "scopes": scope.split(",") if isinstance(scope, str) else list(scope),
+                "created_at": jwt_payload.get("created_at"),
+                "expires_at": jwt_payload.get("expires_at")
+            }
+
+        token_data = await storageManager.read_token(user_id)
         
         if not token_data:
             await ctx.warning(f"No OAuth token found for user: {user_id}")
-            oauth_url = f"https://slack.com/oauth/v2/authorize?client_id={slack_client_id}&scope=chat:write,channels:read,groups:read,im:read,mpim:read&redirect_uri={urllib.parse.quote(slack_redirect_uri)}"
             return {
                 "authorized": False,
                 "user_id": user_id,
                 "message": "No OAuth token found. Please complete the OAuth flow.",
-                "oauth_url": oauth_url
+                "oauth_url": SLACK_OAUTH_BASE_URL
             }
         
         await ctx.info(f"OAuth token found for user: {user_id}")
+        scope = token_data.get("scope")
         return {
             "authorized": True,
             "user_id": user_id,
             "team_name": token_data.get("team_name"),
             "team_id": token_data.get("team_id"),
-            "scopes": token_data.get("scope", "").split(",") if token_data.get("scope") else [],
+            "scopes": scope.split(",") if scope else [],
             "created_at": token_data.get("created_at"),
             "expires_at": token_data.get("expires_at")
         }
@@ -86,10 +118,26 @@ async def check_oauth_status(ctx: Context = None) -> Dict[str, Any]:
             "message": "Unable to check OAuth status. Please ensure you are authenticated."
         }
 
+# Read-only stand-in for a missing nested object (response_metadata, message) that is only read from
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+# Parameter types shared by several tools; one FieldInfo each instead of a copy per signature
+MessageChannel = Annotated[str, Field(description="Channel ID where the message is located")]
+PaginationCursor = Annotated[Optional[str], Field(description="Pagination cursor")]
+FetchAll = Annotated[bool, Field(description="Follow pagination and return all pages (up to max_pages)")]
+MaxPages = Annotated[int, Field(description="Maximum pages to fetch when fetch_all is set", ge=1, le=50)]
+UploadChannels = Annotated[Union[str, List[str]], Field(description="Channel(s) to upload file to")]
+UploadThreadTs = Annotated[Optional[str], Field(description="Thread timestamp to upload to")]
+FileTitle = Annotated[Optional[str], Field(description="File title")]
+FileComment = Annotated[Optional[str], Field(description="Comment to add with file")]
+MaxDownloadBytes = Annotated[Optional[int], Field(description="Maximum size in bytes for files fetched from a URL (default 100 MiB)", ge=1)]
+EmojiName = Annotated[str, Field(description="Emoji name (without colons, e.g., 'thumbsup')")]
+
 # ==================== CHAT & MESSAGING TOOLS ====================
 
-@mcp.tool
+@slack_tool
 async def send_slack_message(
+    slack_service: SlackBotAPIService,
     channel: Annotated[str, Field(description="Channel ID or name (e.g., '#general' or 'C1234567890')")],
     text: Annotated[Optional[str], Field(description="Message text to send")] = None,
     blocks: Annotated[Optional[List[Dict]], Field(description="Slack Block Kit blocks for rich formatting")] = None,
@@ -105,10 +153,6 @@ async def send_slack_message(
         await ctx.error("Neither text nor blocks provided")
         raise ValueError("Either text or blocks must be provided")
     
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.send_message(
         channel=channel,
         text=text,
@@ -121,21 +165,59 @@ async def send_slack_message(
     )
     
     if result.ok:
+        data = result.data
         await ctx.info(f"Message sent successfully to {channel}")
         return {
             "success": True,
-            "channel": result.data.get("channel"),
-            "timestamp": result.data.get("ts"),
+            "channel": data.get("channel"),
+            "timestamp": data.get("ts"),
             "message": "Message sent successfully",
-            "permalink": result.data.get("permalink", "")
+            "permalink": data.get("permalink", "")
         }
-    else:
-        await ctx.error(f"Failed to send message: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to send message", result)
 
-@mcp.tool
+_BULK_MESSAGE_FIELDS = frozenset({
+    "channel", "text", "blocks", "attachments", "thread_ts", "username", "icon_emoji", "icon_url"
+})
+
+@slack_tool
+async def send_slack_messages_bulk(
+    slack_service: SlackBotAPIService,
+    messages: Annotated[List[Dict[str, Any]], Field(description="Messages to send; each takes the send_slack_message arguments (channel plus text or blocks)")],
+    ctx: Context = None
+) -> Dict[str, Any]:
+    """Send several Slack messages concurrently; results are returned in input order"""
+    for index, message in enumerate(messages):
+        unknown = message.keys() - _BULK_MESSAGE_FIELDS
+        if unknown or not message.get("channel") or not (message.get("text") or message.get("blocks")):
+            await ctx.error(f"Invalid message at index {index}")
+            raise ValueError(
+                f"Message {index} needs a channel and either text or blocks"
+                + (f"; unknown fields: {', '.join(sorted(unknown))}" if unknown else "")
+            )
+
+    results = await slack_service.send_messages_bulk(messages)
+    sent = sum(1 for result in results if result.ok)
+    await ctx.info(f"Sent {sent} of {len(results)} messages")
+    return {
+        "success": sent == len(results),
+        "sent": sent,
+        "failed": len(results) - sent,
+        "results": [
+            {
+                "success": result.ok,
+                "channel": result.data.get("channel"),
+                "timestamp": result.data.get("ts"),
+                "error": result.error
+            }
+            for result in results
+        ]
+    }
+
+@slack_tool
 async def update_slack_message(
-    channel: Annotated[str, Field(description="Channel ID where the message is located")],
+    slack_service: SlackBotAPIService,
+    channel: MessageChannel,
     ts: Annotated[str, Field(description="Timestamp of the message to update")],
     text: Annotated[Optional[str], Field(description="New message text")] = None,
     blocks: Annotated[Optional[List[Dict]], Field(description="New Slack Block Kit blocks")] = None,
@@ -147,10 +229,6 @@ async def update_slack_message(
         await ctx.error("Neither text nor blocks provided")
         raise ValueError("Either text or blocks must be provided")
     
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.update_message(
         channel=channel,
         ts=ts,
@@ -160,28 +238,24 @@ async def update_slack_message(
     )
     
     if result.ok:
+        data = result.data
         await ctx.info(f"Message updated successfully in {channel}")
         return {
             "success": True,
-            "channel": result.data.get("channel"),
-            "timestamp": result.data.get("ts"),
+            "channel": data.get("channel"),
+            "timestamp": data.get("ts"),
             "message": "Message updated successfully"
         }
-    else:
-        await ctx.error(f"Failed to update message: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to update message", result)
 
-@mcp.tool
+@slack_tool
 async def delete_slack_message(
-    channel: Annotated[str, Field(description="Channel ID where the message is located")],
+    slack_service: SlackBotAPIService,
+    channel: MessageChannel,
     ts: Annotated[str, Field(description="Timestamp of the message to delete")],
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Delete a Slack message"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.delete_message(channel=channel, ts=ts)
     
     if result.ok:
@@ -192,12 +266,11 @@ async def delete_slack_message(
             "timestamp": ts,
             "message": "Message deleted successfully"
         }
-    else:
-        await ctx.error(f"Failed to delete message: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to delete message", result)
 
-@mcp.tool
+@slack_tool
 async def schedule_slack_message(
+    slack_service: SlackBotAPIService,
     channel: Annotated[str, Field(description="Channel ID to send the scheduled message")],
     post_at: Annotated[int, Field(description="Unix timestamp when to post the message")],
     text: Annotated[Optional[str], Field(description="Message text to schedule")] = None,
@@ -210,10 +283,6 @@ async def schedule_slack_message(
         await ctx.error("Neither text nor blocks provided")
         raise ValueError("Either text or blocks must be provided")
     
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.schedule_message(
         channel=channel,
         post_at=post_at,
@@ -223,63 +292,58 @@ async def schedule_slack_message(
     )
     
     if result.ok:
+        data = result.data
         await ctx.info(f"Message scheduled successfully for {channel}")
         return {
             "success": True,
-            "scheduled_message_id": result.data.get("scheduled_message_id"),
-            "channel": result.data.get("channel"),
+            "scheduled_message_id": data.get("scheduled_message_id"),
+            "channel": data.get("channel"),
             "post_at": post_at,
             "message": "Message scheduled successfully"
         }
-    else:
-        await ctx.error(f"Failed to schedule message: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to schedule message", result)
 
 # ==================== CHANNEL MANAGEMENT TOOLS ====================
 
-@mcp.tool
+@slack_tool
 async def list_slack_channels(
+    slack_service: SlackBotAPIService,
     exclude_archived: Annotated[bool, Field(description="Exclude archived channels")] = True,
     limit: Annotated[int, Field(description="Number of channels to return (max 100)")] = 100,
-    cursor: Annotated[Optional[str], Field(description="Pagination cursor")] = None,
+    cursor: PaginationCursor = None,
     types: Annotated[str, Field(description="Channel types to include")] = "public_channel,private_channel",
+    fetch_all: FetchAll = False,
+    max_pages: MaxPages = 10,
     ctx: Context = None
 ) -> Dict[str, Any]:
     """List all Slack channels"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.list_channels(
         exclude_archived=exclude_archived,
         limit=limit,
         cursor=cursor,
-        types=types
+        types=types,
+        max_pages=max_pages if fetch_all else 1
     )
     
     if result.ok:
-        channels = result.data.get("channels", [])
+        data = result.data
+        channels = data.get("channels") or []
         await ctx.info(f"Retrieved {len(channels)} channels")
         return {
             "success": True,
             "channels": channels,
             "total_count": len(channels),
-            "cursor": result.data.get("response_metadata", {}).get("next_cursor")
+            "cursor": (data.get("response_metadata") or _EMPTY_MAPPING).get("next_cursor")
         }
-    else:
-        await ctx.error(f"Failed to list channels: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to list channels", result)
 
-@mcp.tool
+@slack_tool
 async def get_slack_channel_info(
+    slack_service: SlackBotAPIService,
     channel: Annotated[str, Field(description="Channel ID to get information about")],
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Get detailed information about a Slack channel"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.get_channel_info(channel=channel)
     
     if result.ok:
@@ -289,25 +353,20 @@ async def get_slack_channel_info(
             "channel": result.data.get("channel"),
             "message": "Channel info retrieved successfully"
         }
-    else:
-        await ctx.error(f"Failed to get channel info: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to get channel info", result)
 
-@mcp.tool
+@slack_tool
 async def create_slack_channel(
+    slack_service: SlackBotAPIService,
     name: Annotated[str, Field(description="Name of the channel to create")],
     is_private: Annotated[bool, Field(description="Whether to create a private channel")] = False,
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Create a new Slack channel"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.create_channel(name=name, is_private=is_private)
     
     if result.ok:
-        channel_info = result.data.get("channel", {})
+        channel_info = result.data.get("channel") or {}
         await ctx.info(f"Channel '{name}' created successfully")
         return {
             "success": True,
@@ -315,20 +374,15 @@ async def create_slack_channel(
             "channel_id": channel_info.get("id"),
             "message": f"Channel '{name}' created successfully"
         }
-    else:
-        await ctx.error(f"Failed to create channel: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to create channel", result)
 
-@mcp.tool
+@slack_tool
 async def join_slack_channel(
+    slack_service: SlackBotAPIService,
     channel: Annotated[str, Field(description="Channel ID to join")],
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Join a Slack channel"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.join_channel(channel=channel)
     
     if result.ok:
@@ -338,20 +392,15 @@ async def join_slack_channel(
             "channel": result.data.get("channel"),
             "message": "Channel joined successfully"
         }
-    else:
-        await ctx.error(f"Failed to join channel: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to join channel", result)
 
-@mcp.tool
+@slack_tool
 async def leave_slack_channel(
+    slack_service: SlackBotAPIService,
     channel: Annotated[str, Field(description="Channel ID to leave")],
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Leave a Slack channel"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.leave_channel(channel=channel)
     
     if result.ok:
@@ -360,21 +409,16 @@ async def leave_slack_channel(
             "success": True,
             "message": "Channel left successfully"
         }
-    else:
-        await ctx.error(f"Failed to leave channel: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to leave channel", result)
 
-@mcp.tool
+@slack_tool
 async def invite_to_slack_channel(
+    slack_service: SlackBotAPIService,
     channel: Annotated[str, Field(description="Channel ID to invite users to")],
     users: Annotated[Union[str, List[str]], Field(description="User ID(s) to invite (comma-separated string or list)")],
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Invite users to a Slack channel"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.invite_to_channel(channel=channel, users=users)
     
     if result.ok:
@@ -384,21 +428,16 @@ async def invite_to_slack_channel(
             "channel": result.data.get("channel"),
             "message": "Users invited successfully"
         }
-    else:
-        await ctx.error(f"Failed to invite users: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to invite users", result)
 
-@mcp.tool
+@slack_tool
 async def kick_from_slack_channel(
+    slack_service: SlackBotAPIService,
     channel: Annotated[str, Field(description="Channel ID to remove user from")],
     user: Annotated[str, Field(description="User ID to remove from channel")],
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Remove a user from a Slack channel"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.kick_from_channel(channel=channel, user=user)
     
     if result.ok:
@@ -407,21 +446,16 @@ async def kick_from_slack_channel(
             "success": True,
             "message": "User removed from channel successfully"
         }
-    else:
-        await ctx.error(f"Failed to remove user: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to remove user", result)
 
-@mcp.tool
+@slack_tool
 async def set_slack_channel_topic(
+    slack_service: SlackBotAPIService,
     channel: Annotated[str, Field(description="Channel ID to set topic for")],
     topic: Annotated[str, Field(description="New topic for the channel")],
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Set a Slack channel's topic"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.set_channel_topic(channel=channel, topic=topic)
     
     if result.ok:
@@ -431,21 +465,16 @@ async def set_slack_channel_topic(
             "topic": result.data.get("topic"),
             "message": "Channel topic set successfully"
         }
-    else:
-        await ctx.error(f"Failed to set channel topic: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to set channel topic", result)
 
-@mcp.tool
+@slack_tool
 async def set_slack_channel_purpose(
+    slack_service: SlackBotAPIService,
     channel: Annotated[str, Field(description="Channel ID to set purpose for")],
     purpose: Annotated[str, Field(description="New purpose for the channel")],
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Set a Slack channel's purpose"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.set_channel_purpose(channel=channel, purpose=purpose)
     
     if result.ok:
@@ -455,20 +484,15 @@ async def set_slack_channel_purpose(
             "purpose": result.data.get("purpose"),
             "message": "Channel purpose set successfully"
         }
-    else:
-        await ctx.error(f"Failed to set channel purpose: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to set channel purpose", result)
 
-@mcp.tool
+@slack_tool
 async def archive_slack_channel(
+    slack_service: SlackBotAPIService,
     channel: Annotated[str, Field(description="Channel ID to archive")],
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Archive a Slack channel"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.archive_channel(channel=channel)
     
     if result.ok:
@@ -477,20 +501,15 @@ async def archive_slack_channel(
             "success": True,
             "message": "Channel archived successfully"
         }
-    else:
-        await ctx.error(f"Failed to archive channel: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to archive channel", result)
 
-@mcp.tool
+@slack_tool
 async def unarchive_slack_channel(
+    slack_service: SlackBotAPIService,
     channel: Annotated[str, Field(description="Channel ID to unarchive")],
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Unarchive a Slack channel"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.unarchive_channel(channel=channel)
     
     if result.ok:
@@ -499,120 +518,115 @@ async def unarchive_slack_channel(
             "success": True,
             "message": "Channel unarchived successfully"
         }
-    else:
-        await ctx.error(f"Failed to unarchive channel: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to unarchive channel", result)
 
 # ==================== CHANNEL HISTORY TOOLS ====================
 
-@mcp.tool
+@slack_tool
 async def get_slack_channel_history(
+    slack_service: SlackBotAPIService,
     channel: Annotated[str, Field(description="Channel ID to get history from")],
     limit: Annotated[int, Field(description="Number of messages to return (max 100)")] = 100,
-    cursor: Annotated[Optional[str], Field(description="Pagination cursor")] = None,
+    cursor: PaginationCursor = None,
     latest: Annotated[Optional[str], Field(description="Latest message timestamp to include")] = None,
     oldest: Annotated[Optional[str], Field(description="Oldest message timestamp to include")] = None,
+    fetch_all: FetchAll = False,
+    max_pages: MaxPages = 10,
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Get message history from a Slack channel"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.get_channel_history(
         channel=channel,
         limit=limit,
         cursor=cursor,
         latest=latest,
-        oldest=oldest
+        oldest=oldest,
+        max_pages=max_pages if fetch_all else 1
     )
     
     if result.ok:
-        messages = result.data.get("messages", [])
+        data = result.data
+        messages = data.get("messages") or []
         await ctx.info(f"Retrieved {len(messages)} messages from {channel}")
         return {
             "success": True,
             "messages": messages,
             "total_count": len(messages),
-            "cursor": result.data.get("response_metadata", {}).get("next_cursor"),
-            "has_more": result.data.get("has_more", False)
+            "cursor": (data.get("response_metadata") or _EMPTY_MAPPING).get("next_cursor"),
+            "has_more": data.get("has_more", False)
         }
-    else:
-        await ctx.error(f"Failed to get channel history: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to get channel history", result)
 
-@mcp.tool
+@slack_tool
 async def get_slack_thread_replies(
+    slack_service: SlackBotAPIService,
     channel: Annotated[str, Field(description="Channel ID where the thread is located")],
     ts: Annotated[str, Field(description="Timestamp of the parent message")],
     limit: Annotated[int, Field(description="Number of replies to return (max 100)")] = 100,
-    cursor: Annotated[Optional[str], Field(description="Pagination cursor")] = None,
+    cursor: PaginationCursor = None,
+    fetch_all: FetchAll = False,
+    max_pages: MaxPages = 10,
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Get replies to a threaded message in Slack"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.get_thread_replies(
         channel=channel,
         ts=ts,
         limit=limit,
-        cursor=cursor
+        cursor=cursor,
+        max_pages=max_pages if fetch_all else 1
     )
     
     if result.ok:
-        messages = result.data.get("messages", [])
+        data = result.data
+        messages = data.get("messages") or []
         await ctx.info(f"Retrieved {len(messages)} thread replies from {channel}")
         return {
             "success": True,
             "messages": messages,
             "total_count": len(messages),
-            "cursor": result.data.get("response_metadata", {}).get("next_cursor"),
-            "has_more": result.data.get("has_more", False)
+            "cursor": (data.get("response_metadata") or _EMPTY_MAPPING).get("next_cursor"),
+            "has_more": data.get("has_more", False)
         }
-    else:
-        await ctx.error(f"Failed to get thread replies: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to get thread replies", result)
 
 # ==================== USER MANAGEMENT TOOLS ====================
 
-@mcp.tool
+@slack_tool
 async def list_slack_users(
+    slack_service: SlackBotAPIService,
     limit: Annotated[int, Field(description="Number of users to return (max 100)")] = 100,
-    cursor: Annotated[Optional[str], Field(description="Pagination cursor")] = None,
+    cursor: PaginationCursor = None,
+    fetch_all: FetchAll = False,
+    max_pages: MaxPages = 10,
     ctx: Context = None
 ) -> Dict[str, Any]:
     """List all users in the Slack workspace"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
-    result = await slack_service.list_users(limit=limit, cursor=cursor)
+    result = await slack_service.list_users(
+        limit=limit,
+        cursor=cursor,
+        max_pages=max_pages if fetch_all else 1
+    )
     
     if result.ok:
-        users = result.data.get("members", [])
+        data = result.data
+        users = data.get("members") or []
         await ctx.info(f"Retrieved {len(users)} users")
         return {
             "success": True,
             "users": users,
             "total_count": len(users),
-            "cursor": result.data.get("response_metadata", {}).get("next_cursor")
+            "cursor": (data.get("response_metadata") or _EMPTY_MAPPING).get("next_cursor")
         }
-    else:
-        await ctx.error(f"Failed to list users: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to list users", result)
 
-@mcp.tool
+@slack_tool
 async def get_slack_user_info(
+    slack_service: SlackBotAPIService,
     user: Annotated[str, Field(description="User ID to get information about")],
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Get detailed information about a Slack user"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.get_user_info(user=user)
     
     if result.ok:
@@ -622,20 +636,15 @@ async def get_slack_user_info(
             "user": result.data.get("user"),
             "message": "User info retrieved successfully"
         }
-    else:
-        await ctx.error(f"Failed to get user info: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to get user info", result)
 
-@mcp.tool
+@slack_tool
 async def get_slack_user_profile(
+    slack_service: SlackBotAPIService,
     user: Annotated[str, Field(description="User ID to get profile for")],
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Get a Slack user's profile information"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.get_user_profile(user=user)
     
     if result.ok:
@@ -645,24 +654,21 @@ async def get_slack_user_profile(
             "profile": result.data.get("profile"),
             "message": "User profile retrieved successfully"
         }
-    else:
-        await ctx.error(f"Failed to get user profile: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to get user profile", result)
 
-@mcp.tool
+_PRESENCE_VALUES = frozenset({"auto", "away"})
+
+@slack_tool
 async def set_slack_user_presence(
+    slack_service: SlackBotAPIService,
     presence: Annotated[str, Field(description="Presence to set (auto or away)")],
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Set the bot's presence status"""
-    if presence not in ["auto", "away"]:
+    if presence not in _PRESENCE_VALUES:
         await ctx.error("Presence must be either 'auto' or 'away'")
         return {"success": False, "error": "Invalid presence value"}
     
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.set_user_presence(presence=presence)
     
     if result.ok:
@@ -672,38 +678,35 @@ async def set_slack_user_presence(
             "presence": presence,
             "message": f"Presence set to {presence}"
         }
-    else:
-        await ctx.error(f"Failed to set presence: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to set presence", result)
 
 # ==================== FILE MANAGEMENT TOOLS ====================
 
-@mcp.tool
+@slack_tool
 async def upload_slack_file(
-    channels: Annotated[Union[str, List[str]], Field(description="Channel(s) to upload file to")],
+    slack_service: SlackBotAPIService,
+    channels: UploadChannels,
     file_source: Annotated[str, Field(description="File source: URL, local path, or text content")],
     filename: Annotated[Optional[str], Field(description="Filename (required for text content)")] = None,
-    title: Annotated[Optional[str], Field(description="File title")] = None,
-    initial_comment: Annotated[Optional[str], Field(description="Comment to add with file")] = None,
-    thread_ts: Annotated[Optional[str], Field(description="Thread timestamp to upload to")] = None,
+    title: FileTitle = None,
+    initial_comment: FileComment = None,
+    thread_ts: UploadThreadTs = None,
+    max_bytes: MaxDownloadBytes = None,
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Upload a file to Slack channels (auto-detects URL, path, or content)"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.upload_file(
         channels=channels,
         file_source=file_source,
         filename=filename,
         title=title,
         initial_comment=initial_comment,
-        thread_ts=thread_ts
+        thread_ts=thread_ts,
+        max_bytes=max_bytes
     )
     
     if result.ok:
-        file_info = result.data.get("file", {})
+        file_info = result.data.get("file") or {}
         await ctx.info(f"File uploaded successfully: {file_info.get('name', 'Unknown')}")
         return {
             "success": True,
@@ -711,36 +714,33 @@ async def upload_slack_file(
             "file_id": file_info.get("id"),
             "message": "File uploaded successfully"
         }
-    else:
-        await ctx.error(f"Failed to upload file: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to upload file", result)
 
-@mcp.tool
+@slack_tool
 async def upload_slack_file_from_url(
-    channels: Annotated[Union[str, List[str]], Field(description="Channel(s) to upload file to")],
+    slack_service: SlackBotAPIService,
+    channels: UploadChannels,
     file_url: Annotated[str, Field(description="URL of the file to upload")],
     filename: Annotated[Optional[str], Field(description="Custom filename")] = None,
-    title: Annotated[Optional[str], Field(description="File title")] = None,
-    initial_comment: Annotated[Optional[str], Field(description="Comment to add with file")] = None,
-    thread_ts: Annotated[Optional[str], Field(description="Thread timestamp to upload to")] = None,
+    title: FileTitle = None,
+    initial_comment: FileComment = None,
+    thread_ts: UploadThreadTs = None,
+    max_bytes: MaxDownloadBytes = None,
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Upload a file from URL to Slack channels"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.upload_file_from_url(
         channels=channels,
         file_url=file_url,
         filename=filename,
         title=title,
         initial_comment=initial_comment,
-        thread_ts=thread_ts
+        thread_ts=thread_ts,
+        max_bytes=max_bytes
     )
     
     if result.ok:
-        file_info = result.data.get("file", {})
+        file_info = result.data.get("file") or {}
         await ctx.info(f"File uploaded from URL successfully: {file_info.get('name', 'Unknown')}")
         return {
             "success": True,
@@ -748,25 +748,20 @@ async def upload_slack_file_from_url(
             "file_id": file_info.get("id"),
             "message": "File uploaded from URL successfully"
         }
-    else:
-        await ctx.error(f"Failed to upload file from URL: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to upload file from URL", result)
 
-@mcp.tool
+@slack_tool
 async def upload_slack_file_content(
-    channels: Annotated[Union[str, List[str]], Field(description="Channel(s) to upload file to")],
+    slack_service: SlackBotAPIService,
+    channels: UploadChannels,
     content: Annotated[str, Field(description="Text content to upload as file")],
     filename: Annotated[str, Field(description="Filename for the content")],
-    title: Annotated[Optional[str], Field(description="File title")] = None,
-    initial_comment: Annotated[Optional[str], Field(description="Comment to add with file")] = None,
-    thread_ts: Annotated[Optional[str], Field(description="Thread timestamp to upload to")] = None,
+    title: FileTitle = None,
+    initial_comment: FileComment = None,
+    thread_ts: UploadThreadTs = None,
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Upload text content as a file to Slack channels"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.upload_file_content(
         channels=channels,
         content=content,
@@ -777,7 +772,7 @@ async def upload_slack_file_content(
     )
     
     if result.ok:
-        file_info = result.data.get("file", {})
+        file_info = result.data.get("file") or {}
         await ctx.info(f"Content uploaded as file successfully: {filename}")
         return {
             "success": True,
@@ -785,12 +780,11 @@ async def upload_slack_file_content(
             "file_id": file_info.get("id"),
             "message": "Content uploaded as file successfully"
         }
-    else:
-        await ctx.error(f"Failed to upload content: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to upload content", result)
 
-@mcp.tool
+@slack_tool
 async def list_slack_files(
+    slack_service: SlackBotAPIService,
     user: Annotated[Optional[str], Field(description="Filter by user ID")] = None,
     channel: Annotated[Optional[str], Field(description="Filter by channel ID")] = None,
     ts_from: Annotated[Optional[str], Field(description="Filter files created after this timestamp")] = None,
@@ -798,13 +792,11 @@ async def list_slack_files(
     types: Annotated[Optional[str], Field(description="Filter by file types (comma-separated)")] = None,
     count: Annotated[int, Field(description="Number of files to return")] = 100,
     page: Annotated[int, Field(description="Page number")] = 1,
+    fetch_all: FetchAll = False,
+    max_pages: MaxPages = 10,
     ctx: Context = None
 ) -> Dict[str, Any]:
     """List files in the Slack workspace"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.list_files(
         user=user,
         channel=channel,
@@ -812,33 +804,30 @@ async def list_slack_files(
         ts_to=ts_to,
         types=types,
         count=count,
-        page=page
+        page=page,
+        max_pages=max_pages if fetch_all else 1
     )
     
     if result.ok:
-        files = result.data.get("files", [])
+        data = result.data
+        files = data.get("files") or []
         await ctx.info(f"Retrieved {len(files)} files")
         return {
             "success": True,
             "files": files,
             "total_count": len(files),
-            "paging": result.data.get("paging"),
+            "paging": data.get("paging"),
             "message": "Files listed successfully"
         }
-    else:
-        await ctx.error(f"Failed to list files: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to list files", result)
 
-@mcp.tool
+@slack_tool
 async def get_slack_file_info(
+    slack_service: SlackBotAPIService,
     file: Annotated[str, Field(description="File ID to get information about")],
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Get information about a Slack file"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.get_file_info(file=file)
     
     if result.ok:
@@ -848,20 +837,15 @@ async def get_slack_file_info(
             "file": result.data.get("file"),
             "message": "File info retrieved successfully"
         }
-    else:
-        await ctx.error(f"Failed to get file info: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to get file info", result)
 
-@mcp.tool
+@slack_tool
 async def delete_slack_file(
+    slack_service: SlackBotAPIService,
     file: Annotated[str, Field(description="File ID to delete")],
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Delete a Slack file"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.delete_file(file=file)
     
     if result.ok:
@@ -870,24 +854,19 @@ async def delete_slack_file(
             "success": True,
             "message": "File deleted successfully"
         }
-    else:
-        await ctx.error(f"Failed to delete file: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to delete file", result)
 
 # ==================== REACTION TOOLS ====================
 
-@mcp.tool
+@slack_tool
 async def add_slack_reaction(
-    name: Annotated[str, Field(description="Emoji name (without colons, e.g., 'thumbsup')")],
-    channel: Annotated[str, Field(description="Channel ID where the message is located")],
+    slack_service: SlackBotAPIService,
+    name: EmojiName,
+    channel: MessageChannel,
     timestamp: Annotated[str, Field(description="Timestamp of the message to react to")],
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Add an emoji reaction to a Slack message"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.add_reaction(name=name, channel=channel, timestamp=timestamp)
     
     if result.ok:
@@ -897,22 +876,17 @@ async def add_slack_reaction(
             "reaction": name,
             "message": f"Reaction '{name}' added successfully"
         }
-    else:
-        await ctx.error(f"Failed to add reaction: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to add reaction", result)
 
-@mcp.tool
+@slack_tool
 async def remove_slack_reaction(
-    name: Annotated[str, Field(description="Emoji name (without colons, e.g., 'thumbsup')")],
-    channel: Annotated[str, Field(description="Channel ID where the message is located")],
+    slack_service: SlackBotAPIService,
+    name: EmojiName,
+    channel: MessageChannel,
     timestamp: Annotated[str, Field(description="Timestamp of the message to remove reaction from")],
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Remove an emoji reaction from a Slack message"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.remove_reaction(name=name, channel=channel, timestamp=timestamp)
     
     if result.ok:
@@ -922,48 +896,39 @@ async def remove_slack_reaction(
             "reaction": name,
             "message": f"Reaction '{name}' removed successfully"
         }
-    else:
-        await ctx.error(f"Failed to remove reaction: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to remove reaction", result)
 
-@mcp.tool
+@slack_tool
 async def get_slack_reactions(
-    channel: Annotated[str, Field(description="Channel ID where the message is located")],
+    slack_service: SlackBotAPIService,
+    channel: MessageChannel,
     timestamp: Annotated[str, Field(description="Timestamp of the message to get reactions for")],
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Get reactions for a Slack message"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.get_reactions(channel=channel, timestamp=timestamp)
     
     if result.ok:
+        message = result.data.get("message")
         await ctx.info("Retrieved message reactions successfully")
         return {
             "success": True,
-            "message": result.data.get("message"),
-            "reactions": result.data.get("message", {}).get("reactions", []),
+            "message": message,
+            "reactions": (message or _EMPTY_MAPPING).get("reactions") or [],
             "message_text": "Reactions retrieved successfully"
         }
-    else:
-        await ctx.error(f"Failed to get reactions: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to get reactions", result)
 
 # ==================== PIN TOOLS ====================
 
-@mcp.tool
+@slack_tool
 async def pin_slack_message(
-    channel: Annotated[str, Field(description="Channel ID where the message is located")],
+    slack_service: SlackBotAPIService,
+    channel: MessageChannel,
     timestamp: Annotated[str, Field(description="Timestamp of the message to pin")],
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Pin a message to a Slack channel"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.pin_message(channel=channel, timestamp=timestamp)
     
     if result.ok:
@@ -972,21 +937,16 @@ async def pin_slack_message(
             "success": True,
             "message": "Message pinned successfully"
         }
-    else:
-        await ctx.error(f"Failed to pin message: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to pin message", result)
 
-@mcp.tool
+@slack_tool
 async def unpin_slack_message(
-    channel: Annotated[str, Field(description="Channel ID where the message is located")],
+    slack_service: SlackBotAPIService,
+    channel: MessageChannel,
     timestamp: Annotated[str, Field(description="Timestamp of the message to unpin")],
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Unpin a message from a Slack channel"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.unpin_message(channel=channel, timestamp=timestamp)
     
     if result.ok:
@@ -995,24 +955,19 @@ async def unpin_slack_message(
             "success": True,
             "message": "Message unpinned successfully"
         }
-    else:
-        await ctx.error(f"Failed to unpin message: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to unpin message", result)
 
-@mcp.tool
+@slack_tool
 async def list_slack_pins(
+    slack_service: SlackBotAPIService,
     channel: Annotated[str, Field(description="Channel ID to list pinned items from")],
     ctx: Context = None
 ) -> Dict[str, Any]:
     """List pinned items in a Slack channel"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.list_pins(channel=channel)
     
     if result.ok:
-        pins = result.data.get("items", [])
+        pins = result.data.get("items") or []
         await ctx.info(f"Retrieved {len(pins)} pinned items from {channel}")
         return {
             "success": True,
@@ -1020,14 +975,13 @@ async def list_slack_pins(
             "total_count": len(pins),
             "message": "Pinned items listed successfully"
         }
-    else:
-        await ctx.error(f"Failed to list pins: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to list pins", result)
 
 # ==================== BOOKMARK TOOLS ====================
 
-@mcp.tool
+@slack_tool
 async def add_slack_bookmark(
+    slack_service: SlackBotAPIService,
     channel_id: Annotated[str, Field(description="Channel ID to add bookmark to")],
     title: Annotated[str, Field(description="Bookmark title")],
     type: Annotated[str, Field(description="Bookmark type (link)")],
@@ -1036,10 +990,6 @@ async def add_slack_bookmark(
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Add a bookmark to a Slack channel"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.add_bookmark(
         channel_id=channel_id,
         title=title,
@@ -1049,7 +999,7 @@ async def add_slack_bookmark(
     )
     
     if result.ok:
-        bookmark = result.data.get("bookmark", {})
+        bookmark = result.data.get("bookmark") or {}
         await ctx.info(f"Bookmark '{title}' added successfully to {channel_id}")
         return {
             "success": True,
@@ -1057,21 +1007,16 @@ async def add_slack_bookmark(
             "bookmark_id": bookmark.get("id"),
             "message": "Bookmark added successfully"
         }
-    else:
-        await ctx.error(f"Failed to add bookmark: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to add bookmark", result)
 
-@mcp.tool
+@slack_tool
 async def remove_slack_bookmark(
+    slack_service: SlackBotAPIService,
     channel_id: Annotated[str, Field(description="Channel ID to remove bookmark from")],
     bookmark_id: Annotated[str, Field(description="Bookmark ID to remove")],
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Remove a bookmark from a Slack channel"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.remove_bookmark(channel_id=channel_id, bookmark_id=bookmark_id)
     
     if result.ok:
@@ -1080,24 +1025,19 @@ async def remove_slack_bookmark(
             "success": True,
             "message": "Bookmark removed successfully"
         }
-    else:
-        await ctx.error(f"Failed to remove bookmark: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to remove bookmark", result)
 
-@mcp.tool
+@slack_tool
 async def list_slack_bookmarks(
+    slack_service: SlackBotAPIService,
     channel_id: Annotated[str, Field(description="Channel ID to list bookmarks from")],
     ctx: Context = None
 ) -> Dict[str, Any]:
     """List bookmarks in a Slack channel"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.list_bookmarks(channel_id=channel_id)
     
     if result.ok:
-        bookmarks = result.data.get("bookmarks", [])
+        bookmarks = result.data.get("bookmarks") or []
         await ctx.info(f"Retrieved {len(bookmarks)} bookmarks from {channel_id}")
         return {
             "success": True,
@@ -1105,14 +1045,13 @@ async def list_slack_bookmarks(
             "total_count": len(bookmarks),
             "message": "Bookmarks listed successfully"
         }
-    else:
-        await ctx.error(f"Failed to list bookmarks: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to list bookmarks", result)
 
 # ==================== USER GROUP TOOLS ====================
 
-@mcp.tool
+@slack_tool
 async def create_slack_usergroup(
+    slack_service: SlackBotAPIService,
     name: Annotated[str, Field(description="Name of the user group")],
     handle: Annotated[Optional[str], Field(description="Handle/mention name for the group")] = None,
     description: Annotated[Optional[str], Field(description="Description of the group")] = None,
@@ -1120,10 +1059,6 @@ async def create_slack_usergroup(
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Create a new Slack user group"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.create_usergroup(
         name=name,
         handle=handle,
@@ -1132,7 +1067,7 @@ async def create_slack_usergroup(
     )
     
     if result.ok:
-        usergroup = result.data.get("usergroup", {})
+        usergroup = result.data.get("usergroup") or {}
         await ctx.info(f"User group '{name}' created successfully")
         return {
             "success": True,
@@ -1140,24 +1075,19 @@ async def create_slack_usergroup(
             "usergroup_id": usergroup.get("id"),
             "message": "User group created successfully"
         }
-    else:
-        await ctx.error(f"Failed to create user group: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to create user group", result)
 
-@mcp.tool
+@slack_tool
 async def list_slack_usergroups(
+    slack_service: SlackBotAPIService,
     include_disabled: Annotated[bool, Field(description="Include disabled user groups")] = False,
     ctx: Context = None
 ) -> Dict[str, Any]:
     """List Slack user groups"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.list_usergroups(include_disabled=include_disabled)
     
     if result.ok:
-        usergroups = result.data.get("usergroups", [])
+        usergroups = result.data.get("usergroups") or []
         await ctx.info(f"Retrieved {len(usergroups)} user groups")
         return {
             "success": True,
@@ -1165,12 +1095,11 @@ async def list_slack_usergroups(
             "total_count": len(usergroups),
             "message": "User groups listed successfully"
         }
-    else:
-        await ctx.error(f"Failed to list user groups: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to list user groups", result)
 
-@mcp.tool
+@slack_tool
 async def update_slack_usergroup(
+    slack_service: SlackBotAPIService,
     usergroup: Annotated[str, Field(description="User group ID to update")],
     name: Annotated[Optional[str], Field(description="New name for the group")] = None,
     handle: Annotated[Optional[str], Field(description="New handle for the group")] = None,
@@ -1178,10 +1107,6 @@ async def update_slack_usergroup(
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Update a Slack user group"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.update_usergroup(
         usergroup=usergroup,
         name=name,
@@ -1190,27 +1115,22 @@ async def update_slack_usergroup(
     )
     
     if result.ok:
-        updated_usergroup = result.data.get("usergroup", {})
+        updated_usergroup = result.data.get("usergroup") or {}
         await ctx.info(f"User group {usergroup} updated successfully")
         return {
             "success": True,
             "usergroup": updated_usergroup,
             "message": "User group updated successfully"
         }
-    else:
-        await ctx.error(f"Failed to update user group: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to update user group", result)
 
-@mcp.tool
+@slack_tool
 async def disable_slack_usergroup(
+    slack_service: SlackBotAPIService,
     usergroup: Annotated[str, Field(description="User group ID to disable")],
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Disable a Slack user group"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.disable_usergroup(usergroup=usergroup)
     
     if result.ok:
@@ -1219,67 +1139,49 @@ async def disable_slack_usergroup(
             "success": True,
             "message": "User group disabled successfully"
         }
-    else:
-        await ctx.error(f"Failed to disable user group: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to disable user group", result)
 
 # ==================== TEAM INFO TOOLS ====================
 
-@mcp.tool
-async def get_slack_team_info(ctx: Context = None) -> Dict[str, Any]:
+@slack_tool
+async def get_slack_team_info(slack_service: SlackBotAPIService, ctx: Context = None) -> Dict[str, Any]:
     """Get Slack team information"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.get_team_info()
     
     if result.ok:
-        team = result.data.get("team", {})
+        team = result.data.get("team") or {}
         await ctx.info("Retrieved team information successfully")
         return {
             "success": True,
             "team": team,
             "message": "Team info retrieved successfully"
         }
-    else:
-        await ctx.error(f"Failed to get team info: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to get team info", result)
 
-@mcp.tool
-async def get_slack_team_profile(ctx: Context = None) -> Dict[str, Any]:
+@slack_tool
+async def get_slack_team_profile(slack_service: SlackBotAPIService, ctx: Context = None) -> Dict[str, Any]:
     """Get Slack team profile fields"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.get_team_profile()
     
     if result.ok:
-        profile = result.data.get("profile", {})
+        profile = result.data.get("profile") or {}
         await ctx.info("Retrieved team profile successfully")
         return {
             "success": True,
             "profile": profile,
             "message": "Team profile retrieved successfully"
         }
-    else:
-        await ctx.error(f"Failed to get team profile: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to get team profile", result)
 
 # ==================== EMOJI TOOLS ====================
 
-@mcp.tool
-async def list_slack_emoji(ctx: Context = None) -> Dict[str, Any]:
+@slack_tool
+async def list_slack_emoji(slack_service: SlackBotAPIService, ctx: Context = None) -> Dict[str, Any]:
     """List custom emoji for the Slack team"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.list_emoji()
     
     if result.ok:
-        emoji = result.data.get("emoji", {})
+        emoji = result.data.get("emoji") or {}
         await ctx.info(f"Retrieved {len(emoji)} custom emoji")
         return {
             "success": True,
@@ -1287,54 +1189,45 @@ async def list_slack_emoji(ctx: Context = None) -> Dict[str, Any]:
             "total_count": len(emoji),
             "message": "Custom emoji listed successfully"
         }
-    else:
-        await ctx.error(f"Failed to list emoji: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to list emoji", result)
 
 # ==================== DND (Do Not Disturb) TOOLS ====================
 
-@mcp.tool
+@slack_tool
 async def get_slack_dnd_info(
+    slack_service: SlackBotAPIService,
     user: Annotated[Optional[str], Field(description="User ID to get DND info for (defaults to current user)")] = None,
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Get Do Not Disturb information for a user"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.get_dnd_info(user=user)
     
     if result.ok:
+        data = result.data
         target = user or "current user"
         await ctx.info(f"Retrieved DND info for {target}")
         return {
             "success": True,
-            "dnd_enabled": result.data.get("dnd_enabled"),
-            "next_dnd_start_ts": result.data.get("next_dnd_start_ts"),
-            "next_dnd_end_ts": result.data.get("next_dnd_end_ts"),
-            "snooze_enabled": result.data.get("snooze_enabled"),
-            "snooze_endtime": result.data.get("snooze_endtime"),
+            "dnd_enabled": data.get("dnd_enabled"),
+            "next_dnd_start_ts": data.get("next_dnd_start_ts"),
+            "next_dnd_end_ts": data.get("next_dnd_end_ts"),
+            "snooze_enabled": data.get("snooze_enabled"),
+            "snooze_endtime": data.get("snooze_endtime"),
             "message": "DND info retrieved successfully"
         }
-    else:
-        await ctx.error(f"Failed to get DND info: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to get DND info", result)
 
-@mcp.tool
+@slack_tool
 async def get_slack_dnd_team_info(
+    slack_service: SlackBotAPIService,
     users: Annotated[Optional[List[str]], Field(description="List of user IDs to get DND info for")] = None,
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Get Do Not Disturb information for multiple users"""
-    slack_service, needs_auth = await _get_slack_service(ctx)
-    if needs_auth:
-        return slack_service
-    
     result = await slack_service.get_dnd_team_info(users=users)
     
     if result.ok:
-        users_info = result.data.get("users", {})
+        users_info = result.data.get("users") or {}
         await ctx.info(f"Retrieved DND info for {len(users_info)} users")
         return {
             "success": True,
@@ -1342,7 +1235,5 @@ async def get_slack_dnd_team_info(
             "total_count": len(users_info),
             "message": "Team DND info retrieved successfully"
         }
-    else:
-        await ctx.error(f"Failed to get team DND info: {result.error}")
-        return {"success": False, "error": result.error}
+    return await _failure(ctx, "Failed to get team DND info", result)
 
@@ -1,18 +1,35 @@
-import json
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
+from src.utils.json_handler import loads
 
 # Absolute path to config.json at the repo root (two levels up from src/utils)
 CONFIG_PATH = Path(__file__).resolve().parents[2] / "config.json"
 
+# Last parsed config keyed by the file's mtime; a stat decides whether it is still current
+_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+
 
 def load_config() -> Dict[str, Any]:
+    """Return the parsed config.json, re-reading it only when the file has changed.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    global _cache
+    try:
+        mtime_ns = CONFIG_PATH.stat().st_mtime_ns
+    except OSError:
+        return {}
+    if _cache is not None and _cache[0] == mtime_ns:
+        return _cache[1]
     try:
-        with CONFIG_PATH.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-            return data if isinstance(data, dict) else {}
+        # Raw bytes straight to orjson without a text decode pass
+        data = loads(CONFIG_PATH.read_bytes())
     except Exception:
         return {}
+    if not isinstance(data, dict):
+        data = {}
+    _cache = (mtime_ns, data)
+    return data
 
 
 def has_integration(name: str) -> bool:
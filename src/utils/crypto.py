@@ -1,6 +1,8 @@
 import logging
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
 from cryptography.fernet import Fernet, MultiFernet, InvalidToken
+from src.utils.env_handler import TOKEN_ENCRYPTION_KEYS
 
 logger = logging.getLogger(__name__)
 
@@ -22,18 +24,33 @@ def _build_fernet(keys: List[str]) -> Optional[MultiFernet]:
         return None
 
 
-def encrypt_text(plaintext: str, keys: List[str]) -> str:
+@lru_cache(maxsize=8)
+def _cached_fernet(keys: Tuple[str, ...]) -> Optional[MultiFernet]:
+    return _build_fernet(list(keys))
+
+
+def _get_fernet(keys: Optional[Sequence[str]]) -> Optional[MultiFernet]:
+    """Return a MultiFernet for ``keys`` (default: TOKEN_ENCRYPTION_KEYS), built once per key set."""
+    return _cached_fernet(tuple(TOKEN_ENCRYPTION_KEYS if keys is None else keys))
+
+
+def warm_up() -> None:
+    """Build the default MultiFernet ahead of the first token read or write."""
+    _get_fernet(None)
+
+
+def encrypt_text(plaintext: str, keys: Optional[Sequence[str]] = None) -> str:
     """Encrypt a UTF-8 plaintext string. Returns prefixed ciphertext suitable for DB storage.
     Raises ValueError if no valid keys are provided.
     """
-    f = _build_fernet(keys)
+    f = _get_fernet(keys)
     if not f:
         raise ValueError("TOKEN_ENCRYPTION_KEYS not configured or invalid")
     token = f.encrypt(plaintext.encode("utf-8"))  # bytes
     return f"{CIPHERTEXT_PREFIX}{token.decode('utf-8')}"
 
 
-def decrypt_text(maybe_ciphertext: str, keys: List[str]) -> Tuple[Optional[str], bool]:
+def decrypt_text(maybe_ciphertext: str, keys: Optional[Sequence[str]] = None) -> Tuple[Optional[str], bool]:
     """Decrypt a previously encrypted string.
     Returns (plaintext, encrypted_flag). If not prefixed/encrypted, returns (input, False).
     If decryption fails, returns (None, True).
@@ -44,7 +61,7 @@ def decrypt_text(maybe_ciphertext: str, keys: List[str]) -> Tuple[Optional[str],
         # Not encrypted by us
         return maybe_ciphertext, False
     ct = maybe_ciphertext[len(CIPHERTEXT_PREFIX):]
-    f = _build_fernet(keys)
+    f = _get_fernet(keys)
     if not f:
         logger.error("Encrypted value found but TOKEN_ENCRYPTION_KEYS are not configured")
         return None, True
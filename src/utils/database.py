@@ -1,7 +1,16 @@
+import logging
 import os
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy import create_engine
-from src.utils.env_handler import DATABASE_URL as ENV_DATABASE_URL
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from src.utils.env_handler import (
+    DATABASE_URL as ENV_DATABASE_URL,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE,
+)
+
+logger = logging.getLogger(__name__)
 
 # Engine and Session setup (defaults to local Postgres)
 DATABASE_URL = ENV_DATABASE_URL
@@ -10,5 +19,27 @@ DATABASE_URL = ENV_DATABASE_URL
 if DATABASE_URL.startswith("postgresql://") and "+psycopg" not in DATABASE_URL:
     DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+psycopg://", 1)
 
-engine = create_engine(DATABASE_URL, echo=False, pool_pre_ping=True)
-SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
\ No newline at end of file
+# Explicit pool sizing so concurrent tool calls reuse connections instead of queueing on the defaults (5 + 10).
+# pre_ping and recycle drop connections Postgres or a proxy closed while idle; pool_timeout fails fast when saturated.
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=False,
+    pool_pre_ping=True,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+)
+
+
+@event.listens_for(engine.sync_engine, "checkout")
+def _log_pool_checkout(dbapi_connection, connection_record, connection_proxy):
+    # Makes pool saturation visible when running with debug logging
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("DB pool checkout: %s", engine.pool.status())
+
+# A forked worker gets a fresh pool; close=False leaves the parent's connections to the parent
+os.register_at_fork(after_in_child=lambda: engine.sync_engine.dispose(close=False))
+
+# Async sessions so token reads/writes never block the event loop (psycopg v3 runs async natively)
+SessionLocal = async_sessionmaker(bind=engine, expire_on_commit=False)
\ No newline at end of file
@@ -21,6 +21,13 @@ def _optional(name: str, default: Optional[str] = None) -> Optional[str]:
 # Always required
 DATABASE_URL: str = _require("DATABASE_URL")
 
+# Connection pool tuning (per worker process: the server can hold
+# WEB_CONCURRENCY * (DB_POOL_SIZE + DB_MAX_OVERFLOW) connections in total)
+DB_POOL_SIZE: int = int(_optional("DB_POOL_SIZE", "5") or "5")
+DB_MAX_OVERFLOW: int = int(_optional("DB_MAX_OVERFLOW", "10") or "10")
+DB_POOL_TIMEOUT: int = int(_optional("DB_POOL_TIMEOUT", "10") or "10")
+DB_POOL_RECYCLE: int = int(_optional("DB_POOL_RECYCLE", "1800") or "1800")
+
 # Auth configuration (either JWT_SECRET for HS256 or JWT_JWKS_URL for RS256 JWKS)
 # Make both optional; middleware will decide which to use. By request, set a default JWKS URL.
 JWT_SECRET: Optional[str] = _optional("JWT_SECRET")
@@ -33,11 +40,19 @@ JWT_AUDIENCE: Optional[str] = _optional("JWT_AUDIENCE")
 AUTH_ALLOW_USER_ID_HEADER: str = _optional("AUTH_ALLOW_USER_ID_HEADER", "false") or "false"
 AUTH_USER_ID_HEADER_NAME: str = _optional("AUTH_USER_ID_HEADER_NAME", "x-user-id") or "x-user-id"
 
+# Root log level, configured once at the entrypoint
+LOG_LEVEL: str = (_optional("LOG_LEVEL", "INFO") or "INFO").upper()
+
+# Server process count; more than one worker serves MCP in stateless HTTP mode
+WEB_CONCURRENCY: int = int(_optional("WEB_CONCURRENCY", "1") or "1")
+
 # Conditionally required based on config.json having slack
 if is_slack_enabled():
     SLACK_CLIENT_ID: str = _require("SLACK_CLIENT_ID")
     SLACK_CLIENT_SECRET: str = _require("SLACK_CLIENT_SECRET")
     SLACK_REDIRECT_URI: str = _require("SLACK_REDIRECT_URI")
+    # Upper bound on Slack API calls a single bulk operation keeps in flight
+    SLACK_MAX_CONCURRENT_REQUESTS: int = int(_optional("SLACK_MAX_CONCURRENT_REQUESTS", "3") or "3")
 
 # Encryption keys for token column (comma-separated MultiFernet keys)
 TOKEN_ENCRYPTION_KEYS_RAW: Optional[str] = _optional("TOKEN_ENCRYPTION_KEYS")
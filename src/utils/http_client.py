@@ -0,0 +1,67 @@
+import importlib.util
+import logging
+import os
+from typing import Optional
+import aiohttp
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional h2 package; only enable multiplexing when it is installed
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Shared outbound HTTP clients so connections (and TLS sessions) are reused across requests
+_http_client: Optional[httpx.AsyncClient] = None
+_aiohttp_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide httpx.AsyncClient, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(10.0, connect=5.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30),
+        )
+        logger.debug("Created shared httpx.AsyncClient")
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared client; called from the application lifespan on shutdown."""
+    global _http_client
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+
+
+def get_aiohttp_session() -> aiohttp.ClientSession:
+    """Return the process-wide aiohttp.ClientSession; must be called from a running event loop."""
+    global _aiohttp_session
+    if _aiohttp_session is None or _aiohttp_session.closed:
+        _aiohttp_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=20, enable_cleanup_closed=True),
+            timeout=aiohttp.ClientTimeout(total=15, connect=5),
+        )
+        logger.debug("Created shared aiohttp.ClientSession")
+    return _aiohttp_session
+
+
+async def close_aiohttp_session() -> None:
+    """Close the shared aiohttp session; called from the application lifespan on shutdown."""
+    global _aiohttp_session
+    if _aiohttp_session is not None and not _aiohttp_session.closed:
+        await _aiohttp_session.close()
+    _aiohttp_session = None
+
+
+def _forget_clients_after_fork() -> None:
+    # A forked worker must not reuse the parent's sockets or event-loop-bound sessions;
+    # drop the references (without closing, the parent still owns them) so the child builds its own
+    global _http_client, _aiohttp_session
+    _http_client = None
+    _aiohttp_session = None
+
+
+os.register_at_fork(after_in_child=_forget_clients_after_fork)
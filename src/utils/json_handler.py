@@ -0,0 +1,46 @@
+from typing import Any
+import orjson
+import pydantic_core
+from starlette.responses import JSONResponse
+
+_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes."""
+    return orjson.dumps(obj, option=_DUMPS_OPTIONS)
+
+
+def dumps(obj: Any) -> str:
+    """Serialize to a compact JSON string."""
+    return orjson.dumps(obj, option=_DUMPS_OPTIONS).decode("utf-8")
+
+
+def loads(data: Any) -> Any:
+    """Parse JSON from str or bytes."""
+    return orjson.loads(data)
+
+
+def _jsonable(obj: Any) -> Any:
+    # Types orjson cannot encode natively get pydantic's conversion, as FastMCP's default would
+    return pydantic_core.to_jsonable_python(obj, fallback=str)
+
+
+def tool_serializer(obj: Any) -> str:
+    """Tool result serializer producing the same text as FastMCP's default (pydantic_core.to_json).
+
+    orjson encodes the common case (Slack payloads of dicts, lists, strings and numbers) natively;
+    UTC datetimes are written with a "Z" suffix like pydantic, and anything else is delegated to
+    pydantic_core with the same ``str`` fallback. The only differences are spelling of float
+    exponents (1e+20 vs 1e20) and NaN/Infinity, which orjson writes as null (valid JSON).
+    """
+    return orjson.dumps(
+        obj, default=_jsonable, option=_DUMPS_OPTIONS | orjson.OPT_UTC_Z
+    ).decode("utf-8")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered through orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps_bytes(content)
@@ -0,0 +1,61 @@
+import asyncio
+import time
+from typing import Hashable
+
+from src.utils.cache import TTLCache
+
+
+class AsyncTokenBucket:
+    """Async token bucket: refills ``rate`` tokens per second up to ``burst``.
+
+    Waiters are served in arrival order; ``drain_until`` empties the bucket and
+    blocks acquisitions until a deadline (e.g. after a 429 with Retry-After).
+    """
+
+    def __init__(self, rate: float = 1.0, burst: int = 3):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def drain_until(self, deadline: float) -> None:
+        """Refuse acquisitions until ``deadline`` (time.monotonic() based), then allow a single request."""
+        self._tokens = min(self._tokens, 1.0)
+        self._updated_at = max(self._updated_at, deadline)
+        self._blocked_until = max(self._blocked_until, deadline)
+
+
+class TokenBucketRegistry:
+    """Lazily creates one bucket per key; idle buckets are evicted after ``idle_ttl`` seconds."""
+
+    def __init__(self, rate: float = 1.0, burst: int = 3, maxsize: int = 10_000, idle_ttl: float = 3600.0):
+        self.rate = rate
+        self.burst = burst
+        self._buckets = TTLCache(maxsize=maxsize, ttl=idle_ttl)
+
+    def get(self, key: Hashable) -> AsyncTokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = AsyncTokenBucket(rate=self.rate, burst=self.burst)
+        # Re-setting refreshes the idle timer
+        self._buckets.set(key, bucket)
+        return bucket
@@ -0,0 +1,9 @@
+import os
+
+# src.utils.env_handler reads (and requires) these at import, and src.utils.database builds its
+# engine from DATABASE_URL at import as well. Building an async engine opens no connection, so the
+# tests never need a reachable Postgres; only the psycopg driver has to be importable.
+os.environ.setdefault("DATABASE_URL", "postgresql+psycopg://localhost/test")
+os.environ.setdefault("SLACK_CLIENT_ID", "test-client-id")
+os.environ.setdefault("SLACK_CLIENT_SECRET", "test-client-secret")
+os.environ.setdefault("SLACK_REDIRECT_URI", "http://localhost/slack/oauth/callback")
@@ -0,0 +1,94 @@
+import asyncio
+import json
+import time
+import unittest
+from unittest import mock
+
+import httpx
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+from src.middleware import auth
+
+JWKS_URL = "https://idp.example.com/.well-known/jwks.json"
+
+
+class VerifyTokenCacheTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+        jwk["kid"] = "key-1"
+        self.jwks = {"keys": [jwk]}
+        self.token = jwt.encode(
+            {"sub": "user-1", "exp": int(time.time()) + 300},
+            private_key,
+            algorithm="RS256",
+            headers={"kid": "key-1"},
+        )
+        self.idp_up = True
+        self.fetches = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            self.fetches += 1
+            if not self.idp_up:
+                # A slow failure, so concurrent callers pile up behind the refresh lock
+                await asyncio.sleep(0.05)
+                return httpx.Response(503)
+            return httpx.Response(200, json=self.jwks)
+
+        self.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        patcher = mock.patch.object(auth, "get_http_client", return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.middleware = auth.JWTAuthMiddleware(jwks_url=JWKS_URL)
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+
+    async def test_valid_token_is_accepted_once_the_idp_recovers(self):
+        self.idp_up = False
+        self.assertIsNone(await self.middleware.verify_token(self.token))
+
+        self.idp_up = True
+        later = time.time() + auth._JWKS_RETRY_BACKOFF_SECONDS
+        with mock.patch.object(auth.time, "time", return_value=later):
+            payload = await self.middleware.verify_token(self.token)
+
+        self.assertIsNotNone(payload)
+        self.assertEqual(payload["sub"], "user-1")
+
+    async def test_concurrent_callers_share_one_failed_fetch(self):
+        self.idp_up = False
+        results = await asyncio.gather(*(self.middleware.verify_token(self.token) for _ in range(8)))
+
+        self.assertEqual(results, [None] * 8)
+        self.assertEqual(self.fetches, 1)
+
+    async def test_bad_signature_is_cached_as_rejected(self):
+        header, body, signature = self.token.split(".")
+        forged = ".".join([header, body, signature[::-1]])
+
+        self.assertIsNone(await self.middleware.verify_token(forged))
+        with mock.patch.object(self.middleware, "_decode_token") as decode:
+            self.assertIsNone(await self.middleware.verify_token(forged))
+        decode.assert_not_called()
+
+
+class InvalidKeyTest(unittest.IsolatedAsyncioTestCase):
+    async def test_invalid_key_is_a_definitive_rejection(self):
+        # PyJWT refuses a PEM public key as an HMAC secret with InvalidKeyError, which is not an
+        # InvalidTokenError
+        pem = "-----BEGIN PUBLIC KEY-----\nMIIB\n-----END PUBLIC KEY-----"
+        middleware = auth.JWTAuthMiddleware(secret_key=pem, jwks_url="")
+        token = jwt.encode({"sub": "user-1"}, "another-secret-of-32-bytes-or-more", algorithm="HS256")
+
+        with self.assertNoLogs(auth.logger, level="ERROR"):
+            self.assertIsNone(await middleware.verify_token(token))
+        with mock.patch.object(middleware, "_decode_token") as decode:
+            self.assertIsNone(await middleware.verify_token(token))
+        decode.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import datetime
+import decimal
+import json
+import unittest
+import uuid
+
+from fastmcp import Client, FastMCP
+from fastmcp.tools.tool import default_serializer
+
+from src.utils.json_handler import tool_serializer
+
+RESULT = {
+    "ok": True,
+    "channel": "C0123",
+    "ts": "1712345678.000100",
+    "count": 3,
+    "ratio": 0.25,
+    "members": ["U1", "U2"],
+    "nested": {"a": None, 1: "int key"},
+    "created": datetime.datetime(2024, 5, 1, 12, 30, tzinfo=datetime.timezone.utc),
+    "updated": datetime.datetime(2024, 5, 1, 12, 30, tzinfo=datetime.timezone(datetime.timedelta(hours=2))),
+    "day": datetime.date(2024, 5, 1),
+    "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    "amount": decimal.Decimal("12.50"),
+    "tags": {"only"},
+    "raw": b"bytes",
+}
+
+
+class Opaque:
+    def __str__(self) -> str:
+        return "opaque"
+
+
+def _server(serializer=None) -> FastMCP:
+    mcp = FastMCP("serializer-test", tool_serializer=serializer)
+
+    @mcp.tool
+    def structured() -> dict:
+        return RESULT
+
+    @mcp.tool
+    def untyped():
+        # No return annotation, so no structured output: arbitrary objects reach the serializer
+        return {**RESULT, "other": Opaque()}
+
+    @mcp.tool
+    def text() -> str:
+        return "plain text, not re-encoded"
+
+    return mcp
+
+
+class ToolSerializerTest(unittest.IsolatedAsyncioTestCase):
+    async def _call(self, mcp: FastMCP, name: str) -> str:
+        async with Client(mcp) as client:
+            result = await client.call_tool(name, {})
+        return result.content[0].text
+
+    def test_matches_default_serializer(self):
+        value = {**RESULT, "other": Opaque()}
+        self.assertEqual(tool_serializer(value), default_serializer(value))
+
+    async def test_tool_output_matches_default(self):
+        ours, default = _server(tool_serializer), _server()
+        for name in ("structured", "untyped", "text"):
+            with self.subTest(tool=name):
+                self.assertEqual(await self._call(ours, name), await self._call(default, name))
+
+    async def test_str_result_passes_through(self):
+        self.assertEqual(await self._call(_server(tool_serializer), "text"), "plain text, not re-encoded")
+
+    async def test_output_is_valid_json(self):
+        decoded = json.loads(await self._call(_server(tool_serializer), "untyped"))
+        self.assertEqual(decoded["created"], "2024-05-01T12:30:00Z")
+        self.assertEqual(decoded["nested"], {"a": None, "1": "int key"})
+        self.assertEqual(decoded["other"], "opaque")
+
+
+if __name__ == "__main__":
+    unittest.main()